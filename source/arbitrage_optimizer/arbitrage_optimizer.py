@@ -1,10 +1,9 @@
-from abc import ABC, abstractmethod
 from typing import List
 from source.liquidity_pools.liquidity_pool import LiquidityPool
 from source.liquidity_pools.virtual_liquidity_pool import VirtualLiquidityPool
 
 
-class ArbitrageOptimizer(ABC):
+class ArbitrageOptimizer:
     """
     Abstract base class for arbitrage optimization in a market simulation ecosystem.
 
@@ -21,11 +20,16 @@ class ArbitrageOptimizer(ABC):
         Args:
             liquidity_pools (List[LiquidityPool]): A list of liquidity pools representing the market.
             virtual_liquidity_pool (VirtualLiquidityPool): The virtual liquidity pool for swaps between AS and CT.
+
+        Raises:
+            TypeError: If ArbitrageOptimizer is instantiated directly.
         """
+        if type(self) is ArbitrageOptimizer:
+            raise TypeError("ArbitrageOptimizer is abstract and cannot be instantiated directly.")
+
         self.liquidity_pools = liquidity_pools
         self.virtual_liquidity_pool = virtual_liquidity_pool
 
-    @abstractmethod
     def leverage_arbitrage_opportunity(self):
         """
         Abstract method to determine and execute the sequence of arbitrage operations.
@@ -42,4 +46,4 @@ class ArbitrageOptimizer(ABC):
         Raises:
             NotImplementedError: If the method is not implemented in a subclass.
         """
-        pass
+        raise NotImplementedError("ArbitrageOptimizer subclasses must implement leverage_arbitrage_opportunity.")
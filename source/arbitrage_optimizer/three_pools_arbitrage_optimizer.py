@@ -1,9 +1,37 @@
-from typing import List, Tuple
+import logging
+from math import sqrt
+from typing import List, Optional, Tuple
+import numpy as np
 from scipy.optimize import minimize_scalar
+from source.liquidity_pools.constant_product_formula import ConstantProductFormula
+from source.liquidity_pools.constant_product_liquidity_pool import ConstantProductLiquidityPool
 from source.liquidity_pools.liquidity_pool import LiquidityPool
 from source.liquidity_pools.virtual_liquidity_pool import VirtualLiquidityPool
 from source.arbitrage_optimizer.arbitrage_optimizer import ArbitrageOptimizer
 
+# Arbitrage types. Type 1 buys CT with RT and sells AS for RT (AS price over the peg), Type 2 buys AS with RT and
+# sells CT for RT (AS price below the peg).
+ARB_T1, ARB_T2 = 0, 1
+
+_log = logging.getLogger(__name__)
+
+
+def _arbitrage_profit_kernel(rt_input_quantity, first_fee, first_input_reserve, first_output_reserve,
+                             virtual_fee, virtual_input_reserve, virtual_output_reserve,
+                             second_fee, second_input_reserve, second_output_reserve):
+    """
+    Profit of a route of three constant product swaps, each with its own fee and oriented reserves.
+
+    It runs as plain Python: a compiled function taking ten floats costs more to dispatch than the arithmetic.
+    """
+    effective_input = rt_input_quantity * (1 - first_fee)
+    x = (first_output_reserve * effective_input) / (first_input_reserve + effective_input)
+    effective_input = x * (1 - virtual_fee)
+    y = (virtual_output_reserve * effective_input) / (virtual_input_reserve + effective_input)
+    effective_input = y * (1 - second_fee)
+    rt_output_quantity = (second_output_reserve * effective_input) / (second_input_reserve + effective_input)
+    return rt_output_quantity - rt_input_quantity
+
 
 class ThreePoolsArbitrageOptimizer(ArbitrageOptimizer):
     """
@@ -25,6 +53,23 @@ class ThreePoolsArbitrageOptimizer(ArbitrageOptimizer):
         super().__init__(liquidity_pools, virtual_liquidity_pool)
         self.max_arbitrage_input = 10 ** 6
         self.threshold = 0.001
+        # Whether every pool is a plain constant product pool, enabling the closed form and compiled paths.
+        # Pools are not expected to change formula after the optimizer is built.
+        self._constant_product_route = self._is_constant_product_route()
+        # (reserves fingerprint, (arbitrage type, availability)) of the last detection, reused while no pool reserve
+        # changes. Fees are, like the formulas, not expected to change after the optimizer is built.
+        self._arb_cache = (None, None)
+        # Pools traversed by each arbitrage type as (first pool, its swap, its compute_swap_value, second pool, its
+        # swap, its compute_swap_value), with the bound methods created once. The pools are never replaced.
+        stablecoin_pool, collateral_pool = self.liquidity_pools
+        self._routes = {
+            ARB_T1: (collateral_pool, collateral_pool.swap, collateral_pool.compute_swap_value,
+                     stablecoin_pool, stablecoin_pool.swap, stablecoin_pool.compute_swap_value),
+            ARB_T2: (stablecoin_pool, stablecoin_pool.swap, stablecoin_pool.compute_swap_value,
+                     collateral_pool, collateral_pool.swap, collateral_pool.compute_swap_value),
+        }
+        self._vswap = self.virtual_liquidity_pool.swap
+        self._vcsv = self.virtual_liquidity_pool.compute_swap_value
 
     def leverage_arbitrage_opportunity(self):
         """
@@ -36,50 +81,74 @@ class ThreePoolsArbitrageOptimizer(ArbitrageOptimizer):
         arbitrage_type, arbitrage_available = self.detect_arbitrage()
 
         if arbitrage_available:
-            if arbitrage_type == 'Type 1':  # Arbitrage Type 1 (AS price over the peg)
-                trade_amount = min(self.compute_max_arbitrage_profit("Type 1"), self.max_arbitrage_input)
+            # Type 1 (AS price over the peg) goes through the collateral pool first, Type 2 through the stablecoin pool
+            trade_amount = min(self.compute_max_arbitrage_profit(arbitrage_type), self.max_arbitrage_input)
+            first_pool, first_swap, _, _, second_swap, _ = self._routes[arbitrage_type]
 
-                token, x = self.liquidity_pools[1].swap(self.liquidity_pools[1].token_b, trade_amount)
-                token, x = self.virtual_liquidity_pool.swap(token, x)
-                self.liquidity_pools[0].swap(token, x)
+            token, x = first_swap(first_pool.token_b, trade_amount)
+            token, x = self._vswap(token, x)
+            second_swap(token, x)
 
-            else:  # Arbitrage Type 2 (AS price below the peg)
-                trade_amount = min(self.compute_max_arbitrage_profit("Type 2"), self.max_arbitrage_input)
-
-                token, x = self.liquidity_pools[0].swap(self.liquidity_pools[0].token_b, trade_amount)
-                token, x = self.virtual_liquidity_pool.swap(token, x)
-                self.liquidity_pools[1].swap(token, x)
-
-    def detect_arbitrage(self) -> Tuple[str, bool]:
+    def detect_arbitrage(self) -> Tuple[Optional[int], bool]:
         """
         Identifies whether arbitrage opportunities exist and determines the type.
 
         Returns:
-            Tuple[str, bool]: A tuple where:
-                - str: The type of arbitrage ('Type 1' or 'Type 2') if an opportunity exists, otherwise ''.
+            Tuple[Optional[int], bool]: A tuple where:
+                - int: The type of arbitrage (ARB_T1 or ARB_T2) if an opportunity exists, otherwise None.
                 - bool: True if an arbitrage opportunity exists, False otherwise.
         """
-        t1_profit = self.get_arbitrage_profit("Type 1", 1)
-        t2_profit = self.get_arbitrage_profit("Type 2", 1)
+        stablecoin_pool, collateral_pool = self.liquidity_pools
+        fingerprint = (stablecoin_pool.quantity_token_a, stablecoin_pool.quantity_token_b,
+                       collateral_pool.quantity_token_a, collateral_pool.quantity_token_b,
+                       self.virtual_liquidity_pool.quantity_token_a, self.virtual_liquidity_pool.quantity_token_b)
+        cached_fingerprint, result = self._arb_cache
+        if fingerprint != cached_fingerprint:
+            result = self._detect_arbitrage_uncached()
+            self._arb_cache = (fingerprint, result)
+
+        arbitrage_type = result[0]
+        if arbitrage_type == ARB_T1:
+            if stablecoin_pool.token_a.price < 1:
+                _log.warning("Type 1 arbitrage detected with the stablecoin price below 1: %s",
+                             stablecoin_pool.token_a.price)
+        elif arbitrage_type == ARB_T2:
+            if stablecoin_pool.token_a.price > 1:
+                _log.warning("Type 2 arbitrage detected with the stablecoin price above 1: %s",
+                             stablecoin_pool.token_a.price)
+        return result
+
+    def _detect_arbitrage_uncached(self) -> Tuple[Optional[int], bool]:
+        """
+        Probes both arbitrage routes with an input of 1, without consulting the detection cache.
+
+        Returns:
+            Tuple[Optional[int], bool]: The arbitrage type and availability, as returned by detect_arbitrage.
+        """
+        if self._constant_product_route:
+            # The profit of a constant product route is concave with slope (marginal rate - 1) at zero input,
+            # so a route whose marginal rate does not exceed 1 cannot be profitable and needs no probing
+            t1_profit = self.get_arbitrage_profit(ARB_T1, 1) if self._get_marginal_rate(ARB_T1) > 1 else 0
+            t2_profit = self.get_arbitrage_profit(ARB_T2, 1) if self._get_marginal_rate(ARB_T2) > 1 else 0
+        else:
+            t1_profit = self.get_arbitrage_profit(ARB_T1, 1)
+            t2_profit = self.get_arbitrage_profit(ARB_T2, 1)
 
         if t1_profit > 0:
-            if self.liquidity_pools[0].token_a.price < 1:
-                print("Alert.")
-            return 'Type 1', True
+            return ARB_T1, True
         elif t2_profit > 0:
-            if self.liquidity_pools[0].token_a.price > 1:
-                print("Alert.")
-            return 'Type 2', True
-        return '', False
+            return ARB_T2, True
+        return None, False
 
-    def compute_max_arbitrage_profit(self, arbitrage_type: str):
+    def compute_max_arbitrage_profit(self, arbitrage_type: int):
         """
         Computes the input quantity that maximizes arbitrage profit for a given arbitrage type.
 
-        Uses a bounded optimization technique to find the input amount that yields the highest profit.
+        When all three pools use the constant product formula, the optimum is computed in closed form.
+        Otherwise a bounded optimization technique is used to find the input amount that yields the highest profit.
 
         Args:
-            arbitrage_type (str): The arbitrage type ('Type 1' or 'Type 2').
+            arbitrage_type (int): The arbitrage type (ARB_T1 or ARB_T2).
 
         Returns:
             float: The input quantity that yields the maximum arbitrage profit.
@@ -88,9 +157,26 @@ class ThreePoolsArbitrageOptimizer(ArbitrageOptimizer):
             ValueError: If the optimization process fails.
         """
 
+        route, virtual_input_reserve, virtual_output_reserve = self._get_arbitrage_route(arbitrage_type)
+        first_pool, _, first_csv, second_pool, _, second_csv = route
+
+        # Reserves and swap value methods do not change during the optimization, so they are read only once
+        first_input_reserve, first_output_reserve = first_pool.quantity_token_b, first_pool.quantity_token_a
+        virtual_csv = self._vcsv
+        second_input_reserve, second_output_reserve = second_pool.quantity_token_a, second_pool.quantity_token_b
+
+        if self._constant_product_route:
+            optimal_input = self._constant_product_optimal_input([
+                (1 - first_pool.fee, first_input_reserve, first_output_reserve),
+                (1 - self.virtual_liquidity_pool.fee, virtual_input_reserve, virtual_output_reserve),
+                (1 - second_pool.fee, second_input_reserve, second_output_reserve)])
+            return min(max(optimal_input, 1), self.max_arbitrage_input)
+
         def negative_yield(rt_input_quantity):
             # Negate the yield because we are minimizing
-            return -self.get_arbitrage_profit(arbitrage_type, rt_input_quantity)
+            x = first_csv(rt_input_quantity, first_input_reserve, first_output_reserve)
+            y = virtual_csv(x, virtual_input_reserve, virtual_output_reserve)
+            return rt_input_quantity - second_csv(y, second_input_reserve, second_output_reserve)
 
         # Set bounds for the optimization
         bounds = (1, self.max_arbitrage_input)
@@ -100,12 +186,12 @@ class ThreePoolsArbitrageOptimizer(ArbitrageOptimizer):
 
         if result.success:
             if -result.fun < 0:
-                print("ERROR!!!")
+                _log.warning("Optimal arbitrage input yields a negative profit: %s", -result.fun)
             return result.x
         else:
             raise ValueError("Optimization failed.")
 
-    def get_arbitrage_profit(self, arbitrage_type: str, rt_input_quantity: float):
+    def get_arbitrage_profit(self, arbitrage_type: int, rt_input_quantity: float):
         """
         Calculates the profit from an arbitrage operation based on the input quantity and arbitrage type.
 
@@ -114,7 +200,7 @@ class ThreePoolsArbitrageOptimizer(ArbitrageOptimizer):
         - Type2: Buying AS in Pool 1, swapping AS for CT in the virtual pool, and selling CT in Pool 2.
 
         Args:
-            arbitrage_type (str): The arbitrage type ('Type 1' or 'Type 2').
+            arbitrage_type (int): The arbitrage type (ARB_T1 or ARB_T2).
             rt_input_quantity (float): The input quantity of RT (USD-equivalent).
 
         Returns:
@@ -123,30 +209,147 @@ class ThreePoolsArbitrageOptimizer(ArbitrageOptimizer):
         Note:
             If the input quantity is zero or invalid, returns 0 profit.
         """
-        if arbitrage_type == "Type 1":
-            first_pool = self.liquidity_pools[1]
-            second_pool = self.liquidity_pools[0]
-        else:
-            first_pool = self.liquidity_pools[0]
-            second_pool = self.liquidity_pools[1]
+        route, virtual_input_reserve, virtual_output_reserve = self._get_arbitrage_route(arbitrage_type)
+        first_pool, _, first_csv, second_pool, _, second_csv = route
 
         if rt_input_quantity > 0:
-            x = first_pool.compute_swap_value(rt_input_quantity,
-                                              first_pool.quantity_token_b,
-                                              first_pool.quantity_token_a)
-
-            if arbitrage_type == "Type 1":
-                y = self.virtual_liquidity_pool.compute_swap_value(x,
-                                                                   self.virtual_liquidity_pool.quantity_token_b,
-                                                                   self.virtual_liquidity_pool.quantity_token_a)
-            else:
-                y = self.virtual_liquidity_pool.compute_swap_value(x,
-                                                                   self.virtual_liquidity_pool.quantity_token_a,
-                                                                   self.virtual_liquidity_pool.quantity_token_b)
-            rt_output_quantity = second_pool.compute_swap_value(y,
-                                                                second_pool.quantity_token_a,
-                                                                second_pool.quantity_token_b)
+            if self._constant_product_route:
+                return _arbitrage_profit_kernel(rt_input_quantity, first_pool.fee,
+                                                first_pool.quantity_token_b, first_pool.quantity_token_a,
+                                                self.virtual_liquidity_pool.fee,
+                                                virtual_input_reserve, virtual_output_reserve,
+                                                second_pool.fee,
+                                                second_pool.quantity_token_a, second_pool.quantity_token_b)
+
+            x = first_csv(rt_input_quantity, first_pool.quantity_token_b, first_pool.quantity_token_a)
+            y = self._vcsv(x, virtual_input_reserve, virtual_output_reserve)
+            rt_output_quantity = second_csv(y, second_pool.quantity_token_a, second_pool.quantity_token_b)
 
             return rt_output_quantity - rt_input_quantity
 
         return 0
+
+    def detect_arbitrage_batch(self, states: np.ndarray) -> np.ndarray:
+        """
+        Detects arbitrage opportunities and their optimal trade quantities for many pool states at once.
+
+        Each row holds the reserves of one state: the stablecoin pool (token_a, token_b), the collateral pool
+        (token_a, token_b) and the virtual pool (stablecoin, collateral). The current pool fees are used for every
+        row. Detection follows detect_arbitrage (a route is profitable when an input of 1 yields a profit) and the
+        quantities follow compute_max_arbitrage_profit, evaluated with NumPy arithmetic over all rows.
+
+        Args:
+            states (np.ndarray): Array of shape (N, 6) with the reserves of each state.
+
+        Returns:
+            np.ndarray: Array of shape (N,) with the optimal input quantity, positive for Type 1 arbitrage,
+                        negative for Type 2 arbitrage and 0 when there is no opportunity.
+
+        Raises:
+            ValueError: If states does not have 6 columns or the pools do not all use the constant product formula.
+        """
+        states = np.asarray(states, dtype=np.float64)
+        if states.ndim != 2 or states.shape[1] != 6:
+            raise ValueError("states must be an array of shape (N, 6).")
+        if not self._constant_product_route:
+            raise ValueError("Batch arbitrage detection requires constant product pools.")
+
+        stablecoin_pool_fee = 1 - self.liquidity_pools[0].fee
+        collateral_pool_fee = 1 - self.liquidity_pools[1].fee
+        virtual_pool_fee = 1 - self.virtual_liquidity_pool.fee
+        (stablecoin_pool_a, stablecoin_pool_b, collateral_pool_a, collateral_pool_b,
+         virtual_pool_a, virtual_pool_b) = states.T
+
+        routes = {
+            ARB_T1: [(collateral_pool_fee, collateral_pool_b, collateral_pool_a),
+                     (virtual_pool_fee, virtual_pool_b, virtual_pool_a),
+                     (stablecoin_pool_fee, stablecoin_pool_a, stablecoin_pool_b)],
+            ARB_T2: [(stablecoin_pool_fee, stablecoin_pool_b, stablecoin_pool_a),
+                     (virtual_pool_fee, virtual_pool_a, virtual_pool_b),
+                     (collateral_pool_fee, collateral_pool_a, collateral_pool_b)],
+        }
+        quantities = {}
+        for arbitrage_type, hops in routes.items():
+            a, b, c = self._compose_constant_product_hops(hops)
+            optimal_input = np.clip((np.sqrt(a * b) - b) / c, 1, self.max_arbitrage_input)
+            # The profit of an input of 1 is out(1) - 1 = A / (B + C) - 1
+            quantities[arbitrage_type] = np.where(a / (b + c) - 1 > 0, optimal_input, 0.0)
+
+        return np.where(quantities[ARB_T1] > 0, quantities[ARB_T1], -quantities[ARB_T2])
+
+    def _get_arbitrage_route(self, arbitrage_type: int):
+        """
+        Returns the route of the given arbitrage type, i.e. (first pool, its swap, its compute_swap_value,
+        second pool, its swap, its compute_swap_value), and the virtual pool reserves oriented as
+        (input reserve, output reserve) for the swap performed in the virtual pool.
+        """
+        if arbitrage_type == ARB_T1:
+            return (self._routes[ARB_T1],
+                    self.virtual_liquidity_pool.quantity_token_b, self.virtual_liquidity_pool.quantity_token_a)
+        return (self._routes[ARB_T2],
+                self.virtual_liquidity_pool.quantity_token_a, self.virtual_liquidity_pool.quantity_token_b)
+
+    def _get_marginal_rate(self, arbitrage_type: int) -> float:
+        """
+        Returns the marginal exchange rate of a constant product arbitrage route at zero input, fees included,
+        i.e. how much RT an infinitesimal amount of RT returns after the three swaps.
+        """
+        route, virtual_input_reserve, virtual_output_reserve = self._get_arbitrage_route(arbitrage_type)
+        first_pool, second_pool = route[0], route[3]
+        return ((1 - first_pool.fee) * first_pool.quantity_token_a / first_pool.quantity_token_b
+                * (1 - self.virtual_liquidity_pool.fee) * virtual_output_reserve / virtual_input_reserve
+                * (1 - second_pool.fee) * second_pool.quantity_token_b / second_pool.quantity_token_a)
+
+    def _is_constant_product_route(self) -> bool:
+        """
+        Checks whether all the pools of the arbitrage routes are plain constant product pools.
+        """
+        return all(self._is_constant_product_pool(pool) for pool in (*self.liquidity_pools,
+                                                                     self.virtual_liquidity_pool))
+
+    @staticmethod
+    def _is_constant_product_pool(pool: LiquidityPool) -> bool:
+        """
+        Checks whether the swaps of a pool follow the plain constant product formula, so that the closed form
+        optimum applies.
+        """
+        return (isinstance(pool.formula, ConstantProductFormula)
+                and type(pool).compute_swap_value in (LiquidityPool.compute_swap_value,
+                                                      ConstantProductLiquidityPool.compute_swap_value))
+
+    @staticmethod
+    def _compose_constant_product_hops(hops):
+        """
+        Composes a chain of constant product swaps into a single map x -> A * x / (B + C * x).
+
+        A swap with fee complement g on reserves (R_in, R_out) maps x to a * x / (b + c * x) with
+        (a, b, c) = (g * R_out, R_in, g), and the composition of such maps keeps the same form. Works element-wise
+        on NumPy arrays as well as on floats.
+
+        Args:
+            hops (List[Tuple[float, float, float]]): (1 - fee, input reserve, output reserve) of each swap, in order.
+
+        Returns:
+            Tuple[float, float, float]: The coefficients (A, B, C) of the route.
+        """
+        a, b, c = 1.0, 1.0, 0.0
+        for one_minus_fee, input_reserve, output_reserve in hops:
+            a, b, c = a * one_minus_fee * output_reserve, b * input_reserve, input_reserve * c + one_minus_fee * a
+        return a, b, c
+
+    @classmethod
+    def _constant_product_optimal_input(cls, hops) -> float:
+        """
+        Computes the input quantity that maximizes the profit of a chain of constant product swaps.
+
+        With the route written as out(x) = A * x / (B + C * x), the profit out(x) - x is maximized where
+        A * B / (B + C * x)^2 = 1.
+
+        Args:
+            hops (List[Tuple[float, float, float]]): (1 - fee, input reserve, output reserve) of each swap, in order.
+
+        Returns:
+            float: The optimal input quantity, negative when no input is profitable.
+        """
+        a, b, c = cls._compose_constant_product_hops(hops)
+        return (sqrt(a * b) - b) / c
@@ -1,12 +1,84 @@
 import os
+import queue
+import time
 import tkinter
+from collections import deque
 from pathlib import Path
 from tkinter import Tk, Canvas, Entry, Button, PhotoImage
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
+import numpy as np
+from PIL import Image, ImageDraw, ImageTk
 from source.simulations.three_pools_live_simulation import ThreePoolsLiveSimulation
 
 
+# Static rectangles of the dashboard as (x0, y0, x1, y1, fill): graph frames, the speed box and table rules
+_STATIC_RECTANGLES = (
+    (41, 32, 641, 432, "#D9D9D9"),
+    (683, 32, 1283, 432, "#D9D9D9"),
+    (41, 468, 641, 868, "#D9D9D9"),
+    (695, 709, 936, 765, "#D9D9D9"),
+    (991, 713, 1283, 714, "#000000"),
+    (991, 686, 992, 805, "#000000"),
+    (991, 804, 1283, 805, "#000000"),
+    (1282, 688, 1283, 805, "#000000"),
+    (991, 686, 1283, 687, "#000000"),
+    (1136, 686, 1137, 805, "#000000"),
+    (736, 519, 1229, 520, "#000000"),
+)
+
+# Fonts of the dashboard labels, with negative sizes in pixels
+_FONT_MEDIUM_10 = ("Inter Medium", -10)
+_FONT_BOLD_12 = ("Inter Bold", -12)
+
+# Static labels of the dashboard as (x, y, text, font), anchored at their top-left corner
+_STATIC_TEXTS = (
+    (747, 588, "Free Supply", _FONT_MEDIUM_10),
+    (998, 660, "Inject custom swap", _FONT_BOLD_12),
+    (933, 468, "Simulation status", _FONT_BOLD_12),
+    (690, 660, "Simulation controller", _FONT_BOLD_12),
+    (695, 780, "Speed (blocks/s)", _FONT_MEDIUM_10),
+    (1039, 694, "Stablecoin", _FONT_MEDIUM_10),
+    (793, 500, "Stablecoin", _FONT_MEDIUM_10),
+    (1187, 694, "Collateral", _FONT_MEDIUM_10),
+    (961, 500, "Collateral", _FONT_MEDIUM_10),
+    (1097, 500, "Virtual Liquidity Pool", _FONT_MEDIUM_10),
+    (1010, 755, "Quantity", _FONT_MEDIUM_10),
+    (1155, 755, "Quantity", _FONT_MEDIUM_10),
+    (779, 546, "Price", _FONT_MEDIUM_10),
+    (771, 567, "Supply", _FONT_MEDIUM_10),
+    (912, 588, "Free Supply", _FONT_MEDIUM_10),
+    (944, 546, "Price", _FONT_MEDIUM_10),
+    (936, 567, "Supply", _FONT_MEDIUM_10),
+    (1107, 588, "Delta", _FONT_MEDIUM_10),
+    (1085, 546, "Base Pool", _FONT_MEDIUM_10),
+    (1112, 567, "PRP", _FONT_MEDIUM_10),
+)
+
+# Positions and placeholder texts of the status values, in the order of text_ids
+_VALUE_LABELS = (
+    (850, 546, "0.2"),
+    (850, 567, "0.3"),
+    (850, 588, "0.1"),
+    (1015, 546, "0.5"),
+    (1015, 567, "0.6"),
+    (1015, 588, "0.4"),
+    (1178, 546, "0.8"),
+    (1178, 567, "0.9"),
+    (1178, 588, "0.7"),
+)
+
+# Format specs of the status values, in the order of text_ids: supplies and the VLP base pool in scientific notation
+_VALUE_LABEL_FORMATS = (".3f", ".1e", ".1e", ".3f", ".1e", ".1e", ".1e", ".3f", ".3f")
+
+# Graphs plot at most two points (min and max) per bucket, about one bucket per horizontal pixel of the axes
+_PLOT_BUCKETS = 480
+
+# Image assets of the entries and buttons, decoded once per Tk root by load_images
+_ASSET_NAMES = ("entry_1.png", "entry_2.png", "entry_3.png",
+                "button_1.png", "button_2.png", "button_3.png", "button_4.png", "button_5.png")
+
+
 class GUIDashboard:
     def __init__(self, simulation: ThreePoolsLiveSimulation):
         dirname = os.path.dirname(__file__)
@@ -17,9 +89,32 @@ class GUIDashboard:
         self.time_window = 100
         self.simulation_speed = 10
         self.simulation.change_simulation_speed(self.simulation_speed)
-
+        # The simulation thread publishes snapshots here; update_graphs drains it from the Tk main loop
+        self._queue = queue.Queue(maxsize=4)
+        self.simulation.set_snapshot_queue(self._queue, self.time_window)
+        # Refresh scheduling in milliseconds, adjusted by the rendering times of the last updates
+        self.refresh_interval = 100
+        self.min_refresh_interval = 50
+        self._render_times = deque(maxlen=10)
+        # Graphs are only redrawn once the simulation advanced by this many steps since the last render
+        self.update_every_n_steps = 1
+        self._last_rendered_iteration = -1
+        # Iteration numbers for the x axis, sliced by _x_values and grown on demand
+        self._x_buffer = np.arange(0, dtype=float)
+
+        # Tk root of the dashboard, created with the widgets by display_gui and reset when the window is destroyed
+        self.root = None
+        # Id of the pending update_graphs callback, so that only one update chain is ever scheduled
+        self._after_id = None
         self.canvas = None
+        # PhotoImages of the assets by file name. They need a Tk root, so they are loaded when the window is created,
+        # and the references kept here prevent Tk from dropping the images.
+        self._images = {}
+        self._images_master = None
+        # Canvas ids of the status values: stablecoin price, supply and free supply, collateral price, supply and
+        # free supply, VLP base pool, PRP and delta. The texts last shown are kept to skip unchanged labels.
         self.text_ids = [None] * 9
+        self._value_label_texts = [None] * 9
 
         self.entry_speed = None
         self.entry_swap_st = None
@@ -33,14 +128,82 @@ class GUIDashboard:
         self.delta_fig = None
         self.delta_ax = None
         self.delta_canvas = None
+        self.stablecoin_line = None
+        self.collateral_line = None
+        self.delta_line = None
+        # Background of each graph without its line, captured after every full draw and restored when blitting
+        self._backgrounds = {}
 
         self.display_gui()
 
     def relative_to_assets(self, path: str) -> Path:
         return self.ASSETS_PATH / Path(path)
 
+    def load_images(self, master):
+        """
+        Decodes the image assets for the given Tk root, unless they were already loaded for it.
+
+        Args:
+            master: Tk root owning the images
+        """
+        if self._images_master is master:
+            return
+        self._images = {name: PhotoImage(master=master, file=self.relative_to_assets(name)) for name in _ASSET_NAMES}
+        self._images_master = master
+
+    @staticmethod
+    def render_static_background() -> Image.Image:
+        """
+        Rasterizes the window background and its static rectangles into a single image.
+        Labels stay canvas text items, since their fonts are resolved by Tk.
+        """
+        image = Image.new("RGB", (1324, 900), "#EBEBEB")
+        draw = ImageDraw.Draw(image)
+        for x0, y0, x1, y1, fill in _STATIC_RECTANGLES:
+            # Tk fills [x0, x1) x [y0, y1), while PIL includes the second corner
+            draw.rectangle((x0, y0, x1 - 1, y1 - 1), fill=fill)
+        return image
+
     def display_gui(self):
-        window = Tk()
+        """
+        Shows the dashboard: the widgets are built into a new Tk root unless the previous one is still alive, then
+        the graph updates are scheduled and the Tk main loop is run.
+        """
+        if self.root is None:
+            self.root = Tk()
+            self.root.bind("<Destroy>", self._on_destroy, add="+")
+            self._build_widgets(self.root)
+        self.run()
+
+    def run(self):
+        """
+        Starts updating the graphs and runs the Tk main loop until the window is closed.
+        A pending update from a previous run is cancelled first, so that a single update chain is running.
+        """
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self.update_graphs(self.root)
+        self.root.mainloop()
+
+    def _on_destroy(self, event):
+        """
+        Forgets the Tk root once it is destroyed, so that the next display_gui call builds a new one.
+        The binding is inherited by every child widget, hence the check on the destroyed widget.
+        """
+        if event.widget is self.root:
+            self.root = None
+            # Pending callbacks are dropped along with the root
+            self._after_id = None
+
+    def _build_widgets(self, window):
+        """
+        Creates the canvas, the graphs, the entries and the buttons of the dashboard in the given window.
+
+        Args:
+            window: Tk root or Toplevel hosting the dashboard
+        """
+        self.load_images(window)
 
         window.geometry("1324x900")
         window.configure(bg="#EBEBEB")
@@ -56,100 +219,23 @@ class GUIDashboard:
         )
 
         self.canvas.place(x=0, y=0)
-        self.canvas.create_rectangle(
-            41.0,
-            32.0,
-            641.0,
-            432.0,
-            fill="#D9D9D9",
-            outline="")
-
-        self.canvas.create_rectangle(
-            683.0,
-            32.0,
-            1283.0,
-            432.0,
-            fill="#D9D9D9",
-            outline="")
-
-        self.canvas.create_rectangle(
-            41.0,
-            468.0,
-            641.0,
-            868.0,
-            fill="#D9D9D9",
-            outline="")
-
-        self.canvas.create_rectangle(
-            695.0,
-            709.0,
-            936.0,
-            765.0,
-            fill="#D9D9D9",
-            outline="")
-
-        self.canvas.create_text(
-            747.0,
-            588.0,
-            anchor="nw",
-            text="Free Supply",
-            fill="#000000",
-            font=("Inter Medium", 10 * -1)
-        )
-
-        self.text_ids[2] = self.canvas.create_text(
-            850.0,
-            588.0,
-            anchor="nw",
-            text="0.1",
-            fill="#000000",
-            font=("Inter Medium", 10 * -1)
-        )
-
-        self.canvas.create_text(
-            998.0,
-            660.0,
-            anchor="nw",
-            text="Inject custom swap",
-            fill="#000000",
-            font=("Inter Bold", 12 * -1)
-        )
-
-        self.canvas.create_text(
-            933.0,
-            468.0,
-            anchor="nw",
-            text="Simulation status",
-            fill="#000000",
-            font=("Inter Bold", 12 * -1)
-        )
-
-        self.canvas.create_text(
-            690.0,
-            660.0,
-            anchor="nw",
-            text="Simulation controller",
-            fill="#000000",
-            font=("Inter Bold", 12 * -1)
-        )
-
-        self.canvas.create_text(
-            695.0,
-            780.0,
-            anchor="nw",
-            text="Speed (blocks/s)",
-            fill="#000000",
-            font=("Inter Medium", 10 * -1)
-        )
-
-        entry_image_1 = PhotoImage(
-            file=self.relative_to_assets("entry_1.png"))
+        # The static rectangles are rasterized once into a single image item instead of one canvas item each
+        self._background_image = ImageTk.PhotoImage(self.render_static_background(), master=window)
+        self.canvas.create_image(0, 0, anchor="nw", image=self._background_image)
+        for x, y, text, font in _STATIC_TEXTS:
+            self.canvas.create_text(x, y, anchor="nw", text=text, fill="#000000", font=font)
+        for index, (x, y, text) in enumerate(_VALUE_LABELS):
+            self.text_ids[index] = self.canvas.create_text(x, y, anchor="nw", text=text, fill="#000000",
+                                                           font=_FONT_MEDIUM_10)
+
+        entry_image_1 = self._images["entry_1.png"]
         entry_bg_1 = self.canvas.create_image(
             847.5,
             785.5,
             image=entry_image_1
         )
         self.entry_speed = Entry(
+            window,
             bd=0,
             bg="#FFFFFF",
             fg="#000716",
@@ -162,14 +248,14 @@ class GUIDashboard:
             height=19.0
         )
 
-        entry_image_2 = PhotoImage(
-            file=self.relative_to_assets("entry_2.png"))
+        entry_image_2 = self._images["entry_2.png"]
         entry_bg_2 = self.canvas.create_image(
             1088.5,
             761.5,
             image=entry_image_2
         )
         self.entry_swap_st = Entry(
+            window,
             bd=0,
             bg="#FFFFFF",
             fg="#000716",
@@ -182,9 +268,9 @@ class GUIDashboard:
             height=19.0
         )
 
-        button_image_1 = PhotoImage(
-            file=self.relative_to_assets("button_1.png"))
+        button_image_1 = self._images["button_1.png"]
         button_1 = Button(
+            window,
             image=button_image_1,
             borderwidth=0,
             highlightthickness=0,
@@ -198,9 +284,9 @@ class GUIDashboard:
             height=21.0
         )
 
-        button_image_2 = PhotoImage(
-            file=self.relative_to_assets("button_2.png"))
+        button_image_2 = self._images["button_2.png"]
         button_2 = Button(
+            window,
             image=button_image_2,
             borderwidth=0,
             highlightthickness=0,
@@ -214,124 +300,14 @@ class GUIDashboard:
             height=21.0
         )
 
-        self.canvas.create_text(
-            1039.0,
-            694.0,
-            anchor="nw",
-            text="Stablecoin",
-            fill="#000000",
-            font=("Inter Medium", 10 * -1)
-        )
-
-        self.canvas.create_text(
-            793.0,
-            500.0,
-            anchor="nw",
-            text="Stablecoin",
-            fill="#000000",
-            font=("Inter Medium", 10 * -1)
-        )
-
-        self.canvas.create_text(
-            1187.0,
-            694.0,
-            anchor="nw",
-            text="Collateral",
-            fill="#000000",
-            font=("Inter Medium", 10 * -1)
-        )
-
-        self.canvas.create_text(
-            961.0,
-            500.0,
-            anchor="nw",
-            text="Collateral",
-            fill="#000000",
-            font=("Inter Medium", 10 * -1)
-        )
-
-        self.canvas.create_text(
-            1097.0,
-            500.0,
-            anchor="nw",
-            text="Virtual Liquidity Pool",
-            fill="#000000",
-            font=("Inter Medium", 10 * -1)
-        )
-
-        self.canvas.create_rectangle(
-            991.0,
-            713.0,
-            1283.0,
-            714.0,
-            fill="#000000",
-            outline="")
-
-        self.canvas.create_rectangle(
-            991.0,
-            686.0,
-            992.0000051579439,
-            805.0,
-            fill="#000000",
-            outline="")
-
-        self.canvas.create_rectangle(
-            991.0,
-            804.0,
-            1283.0,
-            805.0,
-            fill="#000000",
-            outline="")
-
-        self.canvas.create_rectangle(
-            1281.9999949294788,
-            688.0,
-            1283.0,
-            805.0,
-            fill="#000000",
-            outline="")
-
-        self.canvas.create_rectangle(
-            991.0,
-            685.9999745599699,
-            1283.0,
-            687.0,
-            fill="#000000",
-            outline="")
-
-        self.canvas.create_rectangle(
-            1136.0,
-            686.0,
-            1137.0000051579439,
-            805.0,
-            fill="#000000",
-            outline="")
-
-        self.canvas.create_rectangle(
-            736.0,
-            519.0,
-            1229.0,
-            520.0,
-            fill="#000000",
-            outline="")
-
-        self.canvas.create_text(
-            1010.0,
-            755.0,
-            anchor="nw",
-            text="Quantity",
-            fill="#000000",
-            font=("Inter Medium", 10 * -1)
-        )
-
-        entry_image_3 = PhotoImage(
-            file=self.relative_to_assets("entry_3.png"))
+        entry_image_3 = self._images["entry_3.png"]
         entry_bg_3 = self.canvas.create_image(
             1233.5,
             761.5,
             image=entry_image_3
         )
         self.entry_swap_ct = Entry(
+            window,
             bd=0,
             bg="#FFFFFF",
             fg="#000716",
@@ -344,162 +320,9 @@ class GUIDashboard:
             height=19.0
         )
 
-        self.canvas.create_text(
-            1155.0,
-            755.0,
-            anchor="nw",
-            text="Quantity",
-            fill="#000000",
-            font=("Inter Medium", 10 * -1)
-        )
-
-        self.canvas.create_text(
-            779.0,
-            546.0,
-            anchor="nw",
-            text="Price",
-            fill="#000000",
-            font=("Inter Medium", 10 * -1)
-        )
-
-        self.text_ids[0] = self.canvas.create_text(
-            850.0,
-            546.0,
-            anchor="nw",
-            text="0.2",
-            fill="#000000",
-            font=("Inter Medium", 10 * -1)
-        )
-
-        self.canvas.create_text(
-            771.0,
-            567.0,
-            anchor="nw",
-            text="Supply",
-            fill="#000000",
-            font=("Inter Medium", 10 * -1)
-        )
-
-        self.text_ids[1] = self.canvas.create_text(
-            850.0,
-            567.0,
-            anchor="nw",
-            text="0.3",
-            fill="#000000",
-            font=("Inter Medium", 10 * -1)
-        )
-
-        self.canvas.create_text(
-            912.0,
-            588.0,
-            anchor="nw",
-            text="Free Supply",
-            fill="#000000",
-            font=("Inter Medium", 10 * -1)
-        )
-
-        self.text_ids[5] = self.canvas.create_text(
-            1015.0,
-            588.0,
-            anchor="nw",
-            text="0.4",
-            fill="#000000",
-            font=("Inter Medium", 10 * -1)
-        )
-
-        self.canvas.create_text(
-            944.0,
-            546.0,
-            anchor="nw",
-            text="Price",
-            fill="#000000",
-            font=("Inter Medium", 10 * -1)
-        )
-
-        self.text_ids[3] = self.canvas.create_text(
-            1015.0,
-            546.0,
-            anchor="nw",
-            text="0.5",
-            fill="#000000",
-            font=("Inter Medium", 10 * -1)
-        )
-
-        self.canvas.create_text(
-            936.0,
-            567.0,
-            anchor="nw",
-            text="Supply",
-            fill="#000000",
-            font=("Inter Medium", 10 * -1)
-        )
-
-        self.text_ids[4] = self.canvas.create_text(
-            1015.0,
-            567.0,
-            anchor="nw",
-            text="0.6",
-            fill="#000000",
-            font=("Inter Medium", 10 * -1)
-        )
-
-        self.canvas.create_text(
-            1107.0,
-            588.0,
-            anchor="nw",
-            text="Delta",
-            fill="#000000",
-            font=("Inter Medium", 10 * -1)
-        )
-
-        self.text_ids[8] = self.canvas.create_text(
-            1178.0,
-            588.0,
-            anchor="nw",
-            text="0.7",
-            fill="#000000",
-            font=("Inter Medium", 10 * -1)
-        )
-
-        self.canvas.create_text(
-            1085.0,
-            546.0,
-            anchor="nw",
-            text="Base Pool",
-            fill="#000000",
-            font=("Inter Medium", 10 * -1)
-        )
-
-        self.text_ids[6] = self.canvas.create_text(
-            1178.0,
-            546.0,
-            anchor="nw",
-            text="0.8",
-            fill="#000000",
-            font=("Inter Medium", 10 * -1)
-        )
-
-        self.canvas.create_text(
-            1112.0,
-            567.0,
-            anchor="nw",
-            text="PRP",
-            fill="#000000",
-            font=("Inter Medium", 10 * -1)
-        )
-
-        self.text_ids[7] = self.canvas.create_text(
-            1178.0,
-            567.0,
-            anchor="nw",
-            text="0.9",
-            fill="#000000",
-            font=("Inter Medium", 10 * -1)
-        )
-
-        button_image_3 = PhotoImage(
-            file=self.relative_to_assets("button_3.png"))
+        button_image_3 = self._images["button_3.png"]
         button_3 = Button(
+            window,
             image=button_image_3,
             borderwidth=0,
             highlightthickness=0,
@@ -513,9 +336,9 @@ class GUIDashboard:
             height=33.0
         )
 
-        button_image_4 = PhotoImage(
-            file=self.relative_to_assets("button_4.png"))
+        button_image_4 = self._images["button_4.png"]
         button_4 = Button(
+            window,
             image=button_image_4,
             borderwidth=0,
             highlightthickness=0,
@@ -529,9 +352,9 @@ class GUIDashboard:
             height=33.0
         )
 
-        button_image_5 = PhotoImage(
-            file=self.relative_to_assets("button_5.png"))
+        button_image_5 = self._images["button_5.png"]
         button_5 = Button(
+            window,
             image=button_image_5,
             borderwidth=0,
             highlightthickness=0,
@@ -567,89 +390,204 @@ class GUIDashboard:
         self.delta_canvas = FigureCanvasTkAgg(figure=self.delta_fig, master=window)
         self.delta_canvas.get_tk_widget().place(x=45, y=468)
 
-        self.update_graphs(window)
+        self.stablecoin_line = self._init_graph(self.stablecoin_ax, self.stablecoin_canvas, "Stablecoin Price", "Price")
+        self.collateral_line = self._init_graph(self.collateral_ax, self.collateral_canvas, "Collateral Price", "Price")
+        self.delta_line = self._init_graph(self.delta_ax, self.delta_canvas, "VLP Delta", "Value")
 
         window.resizable(False, False)
-        window.mainloop()
 
     def update_graphs(self, window):
         """
         Dynamically updates all graphs with the latest simulation data.
+
+        Only the most recent snapshot published by the simulation thread is plotted; older queued ones are skipped.
+        The next update is scheduled after the refresh interval minus the recent average rendering time, so the
+        cadence stays steady under load without piling up callbacks.
+
+        Drawing is asynchronous: full redraws are requested with draw_idle and run by the Tk event loop, which
+        coalesces them. Do not call window.update() or canvas.draw() from here, as they force redundant redraws;
+        use window.update_idletasks() if a refresh must ever be forced.
         """
-        stablecoin_prices = self.simulation.stablecoin_price_history
-        collateral_prices = self.simulation.collateral_price_history
-        delta_variation = self.simulation.delta_variation_history
+        start_time = time.perf_counter()
 
-        current_iteration = self.simulation.number_of_iterations
-        start_iteration = max(current_iteration - self.time_window, 0)
-        x_range = range(start_iteration, current_iteration)
+        snapshot = None
+        try:
+            while True:
+                snapshot = self._queue.get_nowait()
+        except queue.Empty:
+            pass
 
-        stablecoin_prices_slice = stablecoin_prices[start_iteration:current_iteration]
-        collateral_prices_slice = collateral_prices[start_iteration:current_iteration]
+        if snapshot is not None and snapshot[0] - self._last_rendered_iteration >= self.update_every_n_steps:
+            self._render_snapshot(snapshot)
+            self._last_rendered_iteration = snapshot[0]
 
-        if len(x_range) != len(stablecoin_prices_slice) or len(x_range) != len(collateral_prices_slice):
-            print("Data mismatch: x_range and price slices have different lengths.")
-            return
+        self._render_times.append(time.perf_counter() - start_time)
+        average_render_time = sum(self._render_times) / len(self._render_times)
+        next_delay = max(self.min_refresh_interval, int(self.refresh_interval - average_render_time * 1000))
+        self._after_id = window.after(next_delay, self.update_graphs, window)
+
+    def _render_snapshot(self, snapshot):
+        """
+        Plots a (iteration, stablecoin prices, collateral prices, deltas) snapshot and refreshes the value labels.
+        The histories are NumPy arrays, passed to the lines as they are.
+        """
+        current_iteration, stablecoin_prices_slice, collateral_prices_slice, delta_slice = snapshot
+        start_iteration = current_iteration - len(stablecoin_prices_slice)
+        # The snapshot slices share the same window, so x_range always matches their lengths
+        x_range = self._x_values(start_iteration, current_iteration)
 
         if len(stablecoin_prices_slice) > 0 and len(collateral_prices_slice) > 0:
             # Calculate y-axis limits with buffer
-            stablecoin_min = min(stablecoin_prices_slice)
-            stablecoin_max = max(stablecoin_prices_slice)
-            collateral_min = min(collateral_prices_slice)
-            collateral_max = max(collateral_prices_slice)
-
-            buffer_stablecoin = (stablecoin_max - stablecoin_min) + 0.1
-            buffer_collateral = (collateral_max - collateral_min) + 0.1
-
-            # Update Stablecoin Price Graph
-            self.stablecoin_ax.clear()
-            self.stablecoin_ax.plot(x_range, stablecoin_prices_slice)
-            self.stablecoin_ax.set_title("Stablecoin Price")
-            self.stablecoin_ax.set_xlabel("Time")
-            self.stablecoin_ax.set_ylabel("Price")
-            self.stablecoin_ax.set_xlim(start_iteration, current_iteration)
-            self.stablecoin_ax.set_ylim(stablecoin_min - buffer_stablecoin, stablecoin_max + buffer_stablecoin)
-            self.stablecoin_canvas.draw()
-
-            # Update Collateral Price Graph
-            self.collateral_ax.clear()
-            self.collateral_ax.plot(x_range, collateral_prices_slice)
-            self.collateral_ax.set_title("Collateral Price")
-            self.collateral_ax.set_xlabel("Time")
-            self.collateral_ax.set_ylabel("Price")
-            self.collateral_ax.set_xlim(start_iteration, current_iteration)
-            self.collateral_ax.set_ylim(collateral_min - buffer_collateral, collateral_max + buffer_collateral)
-            self.collateral_canvas.draw()
-
-            # Update Delta Graph
-            self.delta_ax.clear()
-            self.delta_ax.plot(delta_variation)
-            self.delta_ax.set_title("VLP Delta")
-            self.delta_ax.set_xlabel("Time")
-            self.delta_ax.set_ylabel("Value")
-            self.delta_ax.set_xlim(start_iteration, current_iteration)
-            self.delta_canvas.draw()
-
-            updated_text = [
-                str(self.simulation.stablecoin_token.price),
-                str(self.simulation.stablecoin_token.supply),
-                str(self.simulation.stablecoin_token.free_supply),
-                str(self.simulation.collateral_token.price),
-                str(self.simulation.collateral_token.supply),
-                str(self.simulation.collateral_token.free_supply),
-                str(self.simulation.virtual_pool.stablecoin_base_quantity),
-                "10",
-                str(self.simulation.virtual_pool.delta)
-            ]
-            for index, text in enumerate(self.text_ids):
-                if index in [1, 2, 4, 5, 6, 9]:
-                    formatted_text = f"{float(updated_text[index]):.1e}"
-                    self.canvas.itemconfig(text, text=formatted_text)
-                else:
-                    self.canvas.itemconfig(text, text=round(float(updated_text[index]), 3))
-                index += 1
-
-            window.after(100, lambda: self.update_graphs(window))
+            stablecoin_min = stablecoin_prices_slice.min()
+            stablecoin_max = stablecoin_prices_slice.max()
+            collateral_min = collateral_prices_slice.min()
+            collateral_max = collateral_prices_slice.max()
+
+            delta_min = delta_slice.min()
+            delta_max = delta_slice.max()
+
+            # 5% of the data range on each side, so the lines fill the graphs
+            buffer_stablecoin = 0.05 * (stablecoin_max - stablecoin_min) + 1e-6
+            buffer_collateral = 0.05 * (collateral_max - collateral_min) + 1e-6
+            buffer_delta = 0.05 * (delta_max - delta_min) + 1e-6
+
+            # Limits only move when the data leaves them, so most ticks keep the cached backgrounds and just blit
+            xlim = self._batched_xlim(self.stablecoin_ax.get_xlim(), start_iteration, current_iteration)
+            self._update_graph(self.stablecoin_ax, self.stablecoin_canvas, self.stablecoin_line,
+                               *self._decimate(x_range, stablecoin_prices_slice), xlim,
+                               self._batched_ylim(self.stablecoin_ax.get_ylim(), stablecoin_min, stablecoin_max,
+                                                  buffer_stablecoin))
+            self._update_graph(self.collateral_ax, self.collateral_canvas, self.collateral_line,
+                               *self._decimate(x_range, collateral_prices_slice), xlim,
+                               self._batched_ylim(self.collateral_ax.get_ylim(), collateral_min, collateral_max,
+                                                  buffer_collateral))
+            self._update_graph(self.delta_ax, self.delta_canvas, self.delta_line,
+                               *self._decimate(x_range, delta_slice), xlim,
+                               self._batched_ylim(self.delta_ax.get_ylim(), delta_min, delta_max, buffer_delta))
+
+            self.update_value_labels()
+
+    def _x_values(self, start_iteration, current_iteration):
+        """
+        Returns the iterations from start_iteration to current_iteration (excluded) as a view of a persistent
+        array, doubling it when the simulation runs past its end.
+        """
+        if current_iteration > len(self._x_buffer):
+            self._x_buffer = np.arange(max(2 * len(self._x_buffer), current_iteration, 1024), dtype=float)
+        return self._x_buffer[start_iteration:current_iteration]
+
+    @staticmethod
+    def _decimate(x, y, buckets=_PLOT_BUCKETS):
+        """
+        Downsamples a series longer than two points per bucket to the minimum and maximum of each bucket, plus its
+        first and last points, in time order, so the plotted line keeps the same envelope and extent at a cost bounded
+        by the axes width.
+
+        Args:
+            x (np.ndarray): iterations
+            y (np.ndarray): values at the iterations
+            buckets (int): number of buckets
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: x and y as they are if short enough, their downsampled copies otherwise
+        """
+        length = len(y)
+        if length <= 2 * buckets:
+            return x, y
+        # Buckets of ceil(length / buckets) points; the last one is padded with the last value, so every point
+        # belongs to a bucket and the padding can only select the last point again
+        bucket_size = -(-length // buckets)
+        bucket_count = -(-length // bucket_size)
+        padded = np.empty(bucket_count * bucket_size, dtype=y.dtype)
+        padded[:length] = y
+        padded[length:] = y[-1]
+        windows = padded.reshape(bucket_count, bucket_size)
+        starts = bucket_size * np.arange(bucket_count)
+        extremes = np.concatenate((windows.argmin(axis=1) + starts, windows.argmax(axis=1) + starts))
+        # The first and last points are kept too, so the line spans the whole window; np.unique restores time order
+        indices = np.unique(np.concatenate(([0, length - 1], np.minimum(extremes, length - 1))))
+        return x[indices], y[indices]
+
+    def _batched_xlim(self, current_xlim, start_iteration, current_iteration):
+        """
+        Returns the x limits for the given data range. The axis jumps a tenth of the time window ahead when the
+        data reaches its right edge, instead of scrolling by one iteration every tick.
+        """
+        low, high = current_xlim
+        if start_iteration >= low and current_iteration <= high:
+            return current_xlim
+        step = max(self.time_window // 10, 1)
+        high = current_iteration + step
+        return max(high - self.time_window - step, 0), high
+
+    @staticmethod
+    def _batched_ylim(current_ylim, data_min, data_max, padding):
+        """
+        Returns the y limits for the given data range. The limits are kept while the data stays within them and
+        still fills a quarter of the axis; otherwise they are refitted with 20% more padding than needed, so small
+        fluctuations do not trigger a refit every tick.
+        """
+        low, high = current_ylim
+        if low <= data_min and data_max <= high and data_max - data_min + 2 * padding >= 0.25 * (high - low):
+            return current_ylim
+        return data_min - 1.2 * padding, data_max + 1.2 * padding
+
+    def update_value_labels(self):
+        """
+        Refreshes the simulation status values. Each label is reconfigured in place with itemconfig, and only
+        when its text changed, so Tk repaints just the labels that differ.
+        """
+        values = (
+            self.simulation.stablecoin_token.price,
+            self.simulation.stablecoin_token.supply,
+            self.simulation.stablecoin_token.free_supply,
+            self.simulation.collateral_token.price,
+            self.simulation.collateral_token.supply,
+            self.simulation.collateral_token.free_supply,
+            self.simulation.virtual_pool.stablecoin_base_quantity,
+            10,
+            self.simulation.virtual_pool.delta
+        )
+        for index, (text_id, value, value_format) in enumerate(zip(self.text_ids, values, _VALUE_LABEL_FORMATS)):
+            text = format(value, value_format)
+            if text != self._value_label_texts[index]:
+                self.canvas.itemconfig(text_id, text=text)
+                self._value_label_texts[index] = text
+
+    def _init_graph(self, ax, canvas, title, ylabel):
+        """
+        Sets the static decorations of a graph and creates its line, drawn apart from the axes when blitting.
+        """
+        ax.set_title(title)
+        ax.set_xlabel("Time")
+        ax.set_ylabel(ylabel)
+        (line,) = ax.plot([], [], animated=True)
+        canvas.mpl_connect("draw_event", lambda event: self._on_draw(ax, canvas, line))
+        return line
+
+    def _on_draw(self, ax, canvas, line):
+        """
+        Captures the background of a graph after a full draw and draws its line on top of it.
+        """
+        self._backgrounds[canvas] = canvas.copy_from_bbox(ax.bbox)
+        ax.draw_artist(line)
+
+    def _update_graph(self, ax, canvas, line, x, y, xlim, ylim):
+        """
+        Updates the data of a graph line. Only the line is redrawn over the cached background, unless the axis
+        limits change and the whole figure needs to be drawn again. Full draws are scheduled with draw_idle, so Tk
+        runs them once it is idle and coalesces the pending ones; until then there is no valid background to blit.
+        """
+        line.set_data(x, y)
+        if ax.get_xlim() != xlim or ax.get_ylim() != ylim:
+            ax.set_xlim(*xlim)
+            ax.set_ylim(*ylim)
+            self._backgrounds.pop(canvas, None)
+            canvas.draw_idle()
+        elif canvas in self._backgrounds:
+            canvas.restore_region(self._backgrounds[canvas])
+            ax.draw_artist(line)
+            canvas.blit(ax.bbox)
 
     def perform_custom_swap(self):
         st_quantity = self.entry_swap_st.get()
@@ -665,7 +603,7 @@ class GUIDashboard:
 
     def change_simulation_speed(self):
         new_speed = self.entry_speed.get()
-        if new_speed != "":
+        if new_speed != "" and int(new_speed) != self.simulation_speed:
             self.simulation_speed = int(new_speed)
             self.simulation.change_simulation_speed(self.simulation_speed)
             print("SPEED CHANGED: new speed", self.simulation_speed)
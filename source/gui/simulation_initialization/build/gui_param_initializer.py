@@ -4,19 +4,102 @@ from tkinter import Tk, Canvas, Entry, Button, PhotoImage
 import os
 
 
+# Image assets of the entries and buttons, decoded once per Tk root by load_images
+_ASSET_NAMES = (tuple(f"entry_{number}.png" for number in range(1, 12))
+                + ("button_1.png", "button_2.png", "button_3.png"))
+
+
+# Labels of the dialog as (x, y, text, font), anchored at their top-left corner
+_TEXTS = (
+    (384, 40, "Set Simulation Parameters", ("Inter SemiBold", -20)),
+    (339, 110, "Stablecoin", ("Inter", -14)),
+    (693, 110, "Collateral", ("Inter", -14)),
+    (447, 341, "Virtual Liquidity Pool", ("Inter", -14)),
+    (272, 158, "Price", ("Inter", -11)),
+    (263, 199, "Supply", ("Inter", -11)),
+    (238, 240, "Free supply", ("Inter", -11)),
+    (256, 281, "Pool fee", ("Inter", -11)),
+    (623, 158, "Price", ("Inter", -11)),
+    (614, 199, "Supply", ("Inter", -11)),
+    (589, 240, "Free supply", ("Inter", -11)),
+    (607, 281, "Pool fee", ("Inter", -11)),
+    (321, 397, "Algorithm", ("Inter", -11)),
+    (243, 438, "Stablecoin base quantity", ("Inter", -11)),
+    (264, 479, "Pool recovery period", ("Inter", -11)),
+    (329, 520, "Pool fee", ("Inter", -11)),
+)
+
+# Parameter entries as (section, parameter, background image, image center x, image center y, default value), in the
+# order of the simulation parameters
+_ENTRIES = (
+    ("stablecoin", "price", "entry_1.png", 374.0, 164.5, "1.0"),
+    ("stablecoin", "supply", "entry_5.png", 374.0, 205.5, "10000"),
+    ("stablecoin", "free_supply", "entry_2.png", 374.0, 246.5, "5000"),
+    ("stablecoin", "pool_fee", "entry_3.png", 374.0, 287.5, "0.01"),
+    ("collateral_token", "price", "entry_9.png", 725.0, 164.5, "5.0"),
+    ("collateral_token", "supply", "entry_11.png", 725.0, 205.5, "10000"),
+    ("collateral_token", "free_supply", "entry_10.png", 725.0, 246.5, "5000"),
+    ("collateral_token", "pool_fee", "entry_4.png", 725.0, 287.5, "0.01"),
+    ("virtual_liquidity_pool", "base", "entry_8.png", 515.0, 444.5, "1000"),
+    ("virtual_liquidity_pool", "pool_recovery", "entry_6.png", 515.0, 485.5, "10"),
+    ("virtual_liquidity_pool", "pool_fee", "entry_7.png", 515.0, 526.5, "0.01"),
+)
+
+
 class GUIParamInitializer:
-    def __init__(self):
+    def __init__(self, simulation_parameters=None):
+        """
+        Asks the simulation parameters with the dialog, unless they are provided.
+
+        Args:
+            simulation_parameters (dict, optional): Parameters in the format produced by the dialog, e.g. from
+                                                    default_parameters. When given, no window is opened, which allows
+                                                    headless and scripted runs.
+        """
         dirname = os.path.dirname(__file__)
         filename = os.path.join(dirname, "../build/assets/frame0")
         self.ASSETS_PATH = (Path(filename))
         self.simulation_parameters = None
-        self.display_gui()
+        # PhotoImages of the assets by file name. They need a Tk root, so they are loaded when the window is created,
+        # and the references kept here prevent Tk from dropping the images.
+        self._images = {}
+        self._images_master = None
+        if simulation_parameters is not None:
+            self.simulation_parameters = simulation_parameters
+        else:
+            self.display_gui()
+
+    @staticmethod
+    def default_parameters():
+        """
+        Returns the parameters the dialog shows by default, as strings like the ones read from its entries.
+
+        Returns:
+            dict: Parameters grouped by stablecoin, collateral_token and virtual_liquidity_pool
+        """
+        parameters = {}
+        for section, parameter, _, _, _, default in _ENTRIES:
+            parameters.setdefault(section, {})[parameter] = default
+        return parameters
 
     def relative_to_assets(self, path: str) -> Path:
         return self.ASSETS_PATH / Path(path)
 
+    def load_images(self, master):
+        """
+        Decodes the image assets for the given Tk root, unless they were already loaded for it.
+
+        Args:
+            master: Tk root owning the images
+        """
+        if self._images_master is master:
+            return
+        self._images = {name: PhotoImage(master=master, file=self.relative_to_assets(name)) for name in _ASSET_NAMES}
+        self._images_master = master
+
     def display_gui(self):
         window = Tk()
+        self.load_images(window)
 
         window.geometry("1024x640")
         window.configure(bg="#EBEBEB")
@@ -32,408 +115,34 @@ class GUIParamInitializer:
         )
 
         canvas.place(x=0, y=0)
-        canvas.create_text(
-            384.0,
-            40.0,
-            anchor="nw",
-            text="Set Simulation Parameters",
-            fill="#000000",
-            font=("Inter SemiBold", 20 * -1)
-        )
-
-        canvas.create_text(
-            339.0,
-            110.0,
-            anchor="nw",
-            text="Stablecoin",
-            fill="#000000",
-            font=("Inter", 14 * -1)
-        )
-
-        canvas.create_text(
-            447.0,
-            341.0,
-            anchor="nw",
-            text="Virtual Liquidity Pool",
-            fill="#000000",
-            font=("Inter", 14 * -1)
-        )
-
-        entry_image_1 = PhotoImage(
-            file=self.relative_to_assets("entry_1.png"))
-        entry_bg_1 = canvas.create_image(
-            374.0,
-            164.5,
-            image=entry_image_1
-        )
-        entry_st_price = Entry(
-            bd=0,
-            bg="#FFFFFF",
-            fg="#000716",
-            highlightthickness=0
-        )
-        entry_st_price.place(
-            x=310.0,
-            y=152.0,
-            width=128.0,
-            height=23.0
-        )
-
-        canvas.create_text(
-            272.0,
-            158.0,
-            anchor="nw",
-            text="Price",
-            fill="#000000",
-            font=("Inter", 11 * -1)
-        )
-
-        canvas.create_text(
-            321.0,
-            397.0,
-            anchor="nw",
-            text="Algorithm",
-            fill="#000000",
-            font=("Inter", 11 * -1)
-        )
-
-        canvas.create_text(
-            243.0,
-            438.0,
-            anchor="nw",
-            text="Stablecoin base quantity",
-            fill="#000000",
-            font=("Inter", 11 * -1)
-        )
-
-        canvas.create_text(
-            264.0,
-            479.0,
-            anchor="nw",
-            text="Pool recovery period",
-            fill="#000000",
-            font=("Inter", 11 * -1)
-        )
-
-        entry_image_2 = PhotoImage(
-            file=self.relative_to_assets("entry_2.png"))
-        entry_bg_2 = canvas.create_image(
-            374.0,
-            246.5,
-            image=entry_image_2
-        )
-        entry_st_free = Entry(
-            bd=0,
-            bg="#FFFFFF",
-            fg="#000716",
-            highlightthickness=0
-        )
-        entry_st_free.place(
-            x=310.0,
-            y=234.0,
-            width=128.0,
-            height=23.0
-        )
-
-        canvas.create_text(
-            238.0,
-            240.0,
-            anchor="nw",
-            text="Free supply",
-            fill="#000000",
-            font=("Inter", 11 * -1)
-        )
-
-        entry_image_3 = PhotoImage(
-            file=self.relative_to_assets("entry_3.png"))
-        entry_bg_3 = canvas.create_image(
-            374.0,
-            287.5,
-            image=entry_image_3
-        )
-        entry_st_fee = Entry(
-            bd=0,
-            bg="#FFFFFF",
-            fg="#000716",
-            highlightthickness=0
-        )
-        entry_st_fee.place(
-            x=310.0,
-            y=275.0,
-            width=128.0,
-            height=23.0
-        )
-
-        canvas.create_text(
-            256.0,
-            281.0,
-            anchor="nw",
-            text="Pool fee",
-            fill="#000000",
-            font=("Inter", 11 * -1)
-        )
-
-        entry_image_4 = PhotoImage(
-            file=self.relative_to_assets("entry_4.png"))
-        entry_bg_4 = canvas.create_image(
-            725.0,
-            287.5,
-            image=entry_image_4
-        )
-        entry_ct_fee = Entry(
-            bd=0,
-            bg="#FFFFFF",
-            fg="#000716",
-            highlightthickness=0
-        )
-        entry_ct_fee.place(
-            x=661.0,
-            y=275.0,
-            width=128.0,
-            height=23.0
-        )
-
-        canvas.create_text(
-            607.0,
-            281.0,
-            anchor="nw",
-            text="Pool fee",
-            fill="#000000",
-            font=("Inter", 11 * -1)
-        )
-
-        entry_image_5 = PhotoImage(
-            file=self.relative_to_assets("entry_5.png"))
-        entry_bg_5 = canvas.create_image(
-            374.0,
-            205.5,
-            image=entry_image_5
-        )
-        entry_st_supply = Entry(
-            bd=0,
-            bg="#FFFFFF",
-            fg="#000716",
-            highlightthickness=0
-        )
-        entry_st_supply.place(
-            x=310.0,
-            y=193.0,
-            width=128.0,
-            height=23.0
-        )
-
-        entry_image_6 = PhotoImage(
-            file=self.relative_to_assets("entry_6.png"))
-        entry_bg_6 = canvas.create_image(
-            515.0,
-            485.5,
-            image=entry_image_6
-        )
-        entry_vlp_pool_recovery = Entry(
-            bd=0,
-            bg="#FFFFFF",
-            fg="#000716",
-            highlightthickness=0
-        )
-        entry_vlp_pool_recovery.place(
-            x=451.0,
-            y=473.0,
-            width=128.0,
-            height=23.0
-        )
-
-        canvas.create_text(
-            329.0,
-            520.0,
-            anchor="nw",
-            text="Pool fee",
-            fill="#000000",
-            font=("Inter", 11 * -1)
-        )
-
-        entry_image_7 = PhotoImage(
-            file=self.relative_to_assets("entry_7.png"))
-        entry_bg_7 = canvas.create_image(
-            515.0,
-            526.5,
-            image=entry_image_7
-        )
-        entry_vlp_fee = Entry(
-            bd=0,
-            bg="#FFFFFF",
-            fg="#000716",
-            highlightthickness=0
-        )
-        entry_vlp_fee.place(
-            x=451.0,
-            y=514.0,
-            width=128.0,
-            height=23.0
-        )
-
-        entry_image_8 = PhotoImage(
-            file=self.relative_to_assets("entry_8.png"))
-        entry_bg_8 = canvas.create_image(
-            515.0,
-            444.5,
-            image=entry_image_8
-        )
-        entry_vlp_base = Entry(
-            bd=0,
-            bg="#FFFFFF",
-            fg="#000716",
-            highlightthickness=0
-        )
-        entry_vlp_base.place(
-            x=451.0,
-            y=432.0,
-            width=128.0,
-            height=23.0
-        )
-
-        canvas.create_text(
-            263.0,
-            199.0,
-            anchor="nw",
-            text="Supply",
-            fill="#000000",
-            font=("Inter", 11 * -1)
-        )
-
-        canvas.create_text(
-            693.0,
-            110.0,
-            anchor="nw",
-            text="Collateral",
-            fill="#000000",
-            font=("Inter", 14 * -1)
-        )
-
-        entry_image_9 = PhotoImage(
-            file=self.relative_to_assets("entry_9.png"))
-        entry_bg_9 = canvas.create_image(
-            725.0,
-            164.5,
-            image=entry_image_9
-        )
-        entry_ct_price = Entry(
-            bd=0,
-            bg="#FFFFFF",
-            fg="#000716",
-            highlightthickness=0
-        )
-        entry_ct_price.place(
-            x=661.0,
-            y=152.0,
-            width=128.0,
-            height=23.0
-        )
-
-        canvas.create_text(
-            623.0,
-            158.0,
-            anchor="nw",
-            text="Price",
-            fill="#000000",
-            font=("Inter", 11 * -1)
-        )
-
-        entry_image_10 = PhotoImage(
-            file=self.relative_to_assets("entry_10.png"))
-        entry_bg_10 = canvas.create_image(
-            725.0,
-            246.5,
-            image=entry_image_10
-        )
-        entry_ct_free = Entry(
-            bd=0,
-            bg="#FFFFFF",
-            fg="#000716",
-            highlightthickness=0
-        )
-        entry_ct_free.place(
-            x=661.0,
-            y=234.0,
-            width=128.0,
-            height=23.0
-        )
-
-        canvas.create_text(
-            589.0,
-            240.0,
-            anchor="nw",
-            text="Free supply",
-            fill="#000000",
-            font=("Inter", 11 * -1)
-        )
-
-        entry_image_11 = PhotoImage(
-            file=self.relative_to_assets("entry_11.png"))
-        entry_bg_11 = canvas.create_image(
-            725.0,
-            205.5,
-            image=entry_image_11
-        )
-        entry_ct_supply = Entry(
-            bd=0,
-            bg="#FFFFFF",
-            fg="#000716",
-            highlightthickness=0
-        )
-        entry_ct_supply.place(
-            x=661.0,
-            y=193.0,
-            width=128.0,
-            height=23.0
-        )
-
-        canvas.create_text(
-            614.0,
-            199.0,
-            anchor="nw",
-            text="Supply",
-            fill="#000000",
-            font=("Inter", 11 * -1)
-        )
+        for x, y, text, font in _TEXTS:
+            canvas.create_text(x, y, anchor="nw", text=text, fill="#000000", font=font)
+
+        entries = {}
+        for section, parameter, image_name, x, y, default in _ENTRIES:
+            canvas.create_image(x, y, image=self._images[image_name])
+            entry = Entry(
+                window,
+                bd=0,
+                bg="#FFFFFF",
+                fg="#000716",
+                highlightthickness=0
+            )
+            # The entry fills its 128x23 background image, which is placed by its center
+            entry.place(x=x - 64, y=y - 12.5, width=128.0, height=23.0)
+            entry.insert(tkinter.END, default)
+            entries[(section, parameter)] = entry
 
         def start_simulation():
-            st_price = entry_st_price.get()
-            st_supply = entry_st_supply.get()
-            st_free = entry_st_free.get()
-            st_pool_fee = entry_st_fee.get()
-            ct_price = entry_ct_price.get()
-            ct_supply = entry_ct_supply.get()
-            ct_free = entry_ct_free.get()
-            ct_pool_fee = entry_ct_fee.get()
-            vlp_base = entry_vlp_base.get()
-            vlp_pool_recovery = entry_vlp_pool_recovery.get()
-            vlp_pool_fee = entry_vlp_fee.get()
-
-            self.simulation_parameters = {
-                "stablecoin": {
-                    "price": st_price,
-                    "supply": st_supply,
-                    "free_supply": st_free,
-                    "pool_fee": st_pool_fee,
-                },
-                "collateral_token": {
-                    "price": ct_price,
-                    "supply": ct_supply,
-                    "free_supply": ct_free,
-                    "pool_fee": ct_pool_fee,
-                },
-                "virtual_liquidity_pool": {
-                    "base": vlp_base,
-                    "pool_recovery": vlp_pool_recovery,
-                    "pool_fee": vlp_pool_fee,
-                }
-            }
+            self.simulation_parameters = {}
+            for (section, parameter), entry in entries.items():
+                self.simulation_parameters.setdefault(section, {})[parameter] = entry.get()
 
             window.destroy()
 
-        button_image_1 = PhotoImage(
-            file=self.relative_to_assets("button_1.png"))
+        button_image_1 = self._images["button_1.png"]
         button_1 = Button(
+            window,
             image=button_image_1,
             borderwidth=0,
             highlightthickness=0,
@@ -447,9 +156,9 @@ class GUIParamInitializer:
             height=25.0
         )
 
-        button_image_2 = PhotoImage(
-            file=self.relative_to_assets("button_2.png"))
+        button_image_2 = self._images["button_2.png"]
         button_2 = Button(
+            window,
             image=button_image_2,
             borderwidth=0,
             highlightthickness=0,
@@ -463,9 +172,9 @@ class GUIParamInitializer:
             height=25.0
         )
 
-        button_image_3 = PhotoImage(
-            file=self.relative_to_assets("button_3.png"))
+        button_image_3 = self._images["button_3.png"]
         button_3 = Button(
+            window,
             image=button_image_3,
             borderwidth=0,
             highlightthickness=0,
@@ -479,20 +188,6 @@ class GUIParamInitializer:
             height=25.0
         )
 
-        entry_st_price.insert(tkinter.END, "1.0")
-        entry_st_supply.insert(tkinter.END, "10000")
-        entry_st_free.insert(tkinter.END, "5000")
-        entry_st_fee.insert(tkinter.END, "0.01")
-
-        entry_ct_price.insert(tkinter.END, "5.0")
-        entry_ct_supply.insert(tkinter.END, "10000")
-        entry_ct_free.insert(tkinter.END, "5000")
-        entry_ct_fee.insert(tkinter.END, "0.01")
-
-        entry_vlp_base.insert(tkinter.END, "1000")
-        entry_vlp_pool_recovery.insert(tkinter.END, "10")
-        entry_vlp_fee.insert(tkinter.END, "0.01")
-
         window.resizable(False, False)
         window.mainloop()
 
@@ -1,4 +1,83 @@
+import numpy as np
+
 from source.liquidity_pools.formula import Formula
+from source.utils.jit import njit
+
+
+@njit(cache=True, fastmath=True, inline='always')
+def _cpf_apply(input_quantity, input_reserve, output_reserve):
+    return (output_reserve * input_quantity) / (input_reserve + input_quantity)
+
+
+@njit(cache=True, fastmath=True)
+def batch_swap(input_quantities, input_reserves, output_reserves, fee):
+    """
+    Computes the output of many independent constant product swaps in a single compiled call.
+
+    Each element i describes a swap of input_quantities[i] against a pool holding input_reserves[i] and
+    output_reserves[i]. The fee is deducted from the input quantity, as in LiquidityPool.compute_swap_value.
+
+    Args:
+        input_quantities (np.ndarray): The amounts of the input token being swapped.
+        input_reserves (np.ndarray): The reserves of the input token, one per swap.
+        output_reserves (np.ndarray): The reserves of the output token, one per swap.
+        fee (float): The pool fee, as a fraction of the input quantity.
+
+    Returns:
+        np.ndarray: The output amount of each swap.
+
+    Raises:
+        ValueError: If any input quantity is negative or any reserve is not positive.
+    """
+    output_amounts = np.empty(input_quantities.shape[0], dtype=np.float64)
+    for i in range(input_quantities.shape[0]):
+        if input_quantities[i] < 0:
+            raise ValueError("Input quantity must be positive.")
+        if input_reserves[i] <= 0:
+            raise ValueError("Input reserve must be positive.")
+        if output_reserves[i] <= 0:
+            raise ValueError("Output reserve must be positive.")
+        output_amounts[i] = _cpf_apply(input_quantities[i] * (1 - fee), input_reserves[i], output_reserves[i])
+    return output_amounts
+
+
+@njit(cache=True, fastmath=True)
+def sequential_swap(input_is_a, input_quantities, quantity_a, quantity_b, fee):
+    """
+    Executes constant product swaps one after the other in a single compiled call, each swap being priced
+    against the reserves left by the previous ones, as with repeated calls to LiquidityPool.swap.
+
+    Args:
+        input_is_a (np.ndarray): Boolean array, True where the swap provides token_a to the pool
+                                 and False where it provides token_b.
+        input_quantities (np.ndarray): The positive amounts of the input tokens to swap.
+        quantity_a (float): The reserve of token_a before the first swap.
+        quantity_b (float): The reserve of token_b before the first swap.
+        fee (float): The pool fee, as a fraction of the input quantity.
+
+    Returns:
+        Tuple[np.ndarray, float, float]: The output amount of each swap and the final reserves of token_a
+                                         and token_b.
+
+    Raises:
+        ValueError: If any input quantity is not positive or any reserve is not positive.
+    """
+    if quantity_a <= 0 or quantity_b <= 0:
+        raise ValueError("Pool reserves must be positive.")
+    output_amounts = np.empty(input_quantities.shape[0], dtype=np.float64)
+    for i in range(input_quantities.shape[0]):
+        if input_quantities[i] <= 0:
+            raise ValueError("Input quantity must be positive.")
+        effective_input = input_quantities[i] * (1 - fee)
+        if input_is_a[i]:
+            output_amounts[i] = _cpf_apply(effective_input, quantity_a, quantity_b)
+            quantity_a += input_quantities[i]
+            quantity_b -= output_amounts[i]
+        else:
+            output_amounts[i] = _cpf_apply(effective_input, quantity_b, quantity_a)
+            quantity_b += input_quantities[i]
+            quantity_a -= output_amounts[i]
+    return output_amounts, quantity_a, quantity_b
 
 
 class ConstantProductFormula(Formula):
@@ -8,9 +87,14 @@ class ConstantProductFormula(Formula):
 
     Methods:
         apply: Calculates the output token amount using the constant product formula.
+        apply_unchecked: Same as apply, without argument validation.
+        apply_vec: Vectorized version of apply over arrays of swaps.
     """
 
-    def apply(self, input_quantity, input_reserve, output_reserve):
+    __slots__ = ()
+
+    @staticmethod
+    def apply(input_quantity, input_reserve, output_reserve):
         """
         Applies the constant product formula to calculate the output amount of a token swap.
 
@@ -43,7 +127,52 @@ class ConstantProductFormula(Formula):
         output_amount = (output_reserve * input_quantity) / (input_reserve + input_quantity)
         return output_amount
 
-    def inverse_apply(self, output_quantity, input_reserve, output_reserve):
+    @staticmethod
+    def apply_unchecked(input_quantity, input_reserve, output_reserve):
+        """
+        Applies the constant product formula without validating the arguments.
+        Callers must guarantee a non-negative input quantity and positive reserves.
+
+        Args:
+            input_quantity (float): The amount of the input token being swapped.
+            input_reserve (float): The current reserve of the input token in the pool.
+            output_reserve (float): The current reserve of the output token in the pool.
+
+        Returns:
+            float: The calculated amount of the output token after the swap.
+        """
+        return (output_reserve * input_quantity) / (input_reserve + input_quantity)
+
+    @staticmethod
+    def apply_vec(input_quantities, input_reserves, output_reserves):
+        """
+        Applies the constant product formula element-wise over arrays of independent swaps.
+
+        Args:
+            input_quantities (np.ndarray): The amounts of the input token being swapped.
+            input_reserves (np.ndarray): The reserves of the input token, one per swap.
+            output_reserves (np.ndarray): The reserves of the output token, one per swap.
+
+        Returns:
+            np.ndarray: The output amount of each swap.
+
+        Raises:
+            ValueError: If any input quantity is negative or any reserve is not positive.
+        """
+        input_quantities = np.asarray(input_quantities, dtype=np.float64)
+        input_reserves = np.asarray(input_reserves, dtype=np.float64)
+        output_reserves = np.asarray(output_reserves, dtype=np.float64)
+        if np.any(input_quantities < 0):
+            raise ValueError("Input quantity must be positive.")
+        if np.any(input_reserves <= 0):
+            raise ValueError("Input reserve must be positive.")
+        if np.any(output_reserves <= 0):
+            raise ValueError("Output reserve must be positive.")
+
+        return (output_reserves * input_quantities) / (input_reserves + input_quantities)
+
+    @staticmethod
+    def inverse_apply(output_quantity, input_reserve, output_reserve):
         """
         Calculates the input token amount required to achieve a desired output amount
         using the constant product formula (CPF).
@@ -79,3 +208,7 @@ class ConstantProductFormula(Formula):
 
         intput_amount = (input_reserve * output_quantity) / (output_reserve - output_quantity)
         return intput_amount
+
+
+# Shared instance: the formula is stateless, so every pool can use the same object
+CPF_INSTANCE = ConstantProductFormula()
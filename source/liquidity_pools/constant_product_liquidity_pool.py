@@ -0,0 +1,111 @@
+import numpy as np
+
+from source.liquidity_pools.constant_product_formula import ConstantProductFormula, CPF_INSTANCE, sequential_swap
+from source.liquidity_pools.liquidity_pool import LiquidityPool
+
+
+class ConstantProductLiquidityPool(LiquidityPool):
+    """
+    A liquidity pool specialized for the constant product formula.
+
+    The formula is inlined in compute_swap_value and compute_inverse_swap_value, so a swap does not go through
+    the generic Formula interface. Results are identical to a LiquidityPool using ConstantProductFormula.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, token_a, token_b, quantity_token_a, quantity_token_b, fee, formula=None):
+        """
+        Initializes the ConstantProductLiquidityPool.
+
+        Args:
+            token_a (Token): The first token in the pool.
+            token_b (Token): The second token in the pool.
+            quantity_token_a (float): Initial quantity of token_a in the pool.
+            quantity_token_b (float): Initial quantity of token_b in the pool.
+            fee (float): Transaction fee percentage (e.g., 0.003 for 0.3% fee).
+            formula (ConstantProductFormula, optional): The formula instance used by the generic methods
+                                                        such as compute_reserve. Defaults to the shared CPF_INSTANCE.
+
+        Raises:
+            TypeError: If formula is not a ConstantProductFormula.
+        """
+        if formula is None:
+            formula = CPF_INSTANCE
+        if not isinstance(formula, ConstantProductFormula):
+            raise TypeError("ConstantProductLiquidityPool requires a ConstantProductFormula.")
+        super().__init__(token_a, token_b, quantity_token_a, quantity_token_b, fee, formula)
+
+    def compute_swap_value(self, input_quantity, input_reserve, output_reserve):
+        """
+        Computes the amount of output token with the constant product formula, after applying the fee.
+        As in LiquidityPool, the arguments are not validated: callers must pass a non-negative input quantity
+        and positive reserves.
+
+        Args:
+            input_quantity (float): The amount of the input token being swapped.
+            input_reserve (float): The current reserve of the input token in the pool.
+            output_reserve (float): The current reserve of the output token in the pool.
+
+        Returns:
+            float: The computed amount of the output token.
+        """
+        effective_input = input_quantity * self._one_minus_fee
+        return (output_reserve * effective_input) / (input_reserve + effective_input)
+
+    def compute_inverse_swap_value(self, output_quantity, input_reserve, output_reserve):
+        """
+        Computes the amount of input token, fee included, needed to obtain output_quantity with the
+        constant product formula.
+
+        Args:
+            output_quantity (float): The desired amount of the output token.
+            input_reserve (float): The current reserve of the input token in the pool.
+            output_reserve (float): The current reserve of the output token in the pool.
+
+        Returns:
+            float: The computed amount of the input token.
+
+        Raises:
+            ValueError: If output_quantity or any reserve is not positive, or if output_quantity exceeds
+                        the output reserve.
+        """
+        if output_quantity <= 0 or input_reserve <= 0 or output_quantity >= output_reserve:
+            raise ValueError("Output quantity and reserves must be positive and the output cannot exceed "
+                             "the output reserve.")
+        return (input_reserve * output_quantity) / ((output_reserve - output_quantity) * self._one_minus_fee)
+
+    def swap_sequence(self, input_is_a, amounts):
+        """
+        Executes a sequence of swaps in a compiled loop. Unlike swap_batch, each swap is priced against the
+        reserves left by the previous one, so the result matches calling swap for every element in order.
+
+        Args:
+            input_is_a (np.ndarray): Boolean array, True where the swap provides token_a to the pool
+                                     and False where it provides token_b.
+            amounts (np.ndarray): The positive amounts of the input tokens to swap.
+
+        Returns:
+            np.ndarray: The amount of output token obtained by each swap.
+
+        Raises:
+            ValueError: If the arrays have different shapes or if any amount is not positive.
+        """
+        input_is_a = np.asarray(input_is_a, dtype=bool)
+        amounts = np.asarray(amounts, dtype=np.float64)
+        if input_is_a.shape != amounts.shape or amounts.ndim != 1:
+            raise ValueError("input_is_a and amounts must be one-dimensional arrays of the same shape.")
+
+        output_amounts, quantity_a, quantity_b = sequential_swap(input_is_a, amounts, float(self.quantity_token_a),
+                                                                 float(self.quantity_token_b), float(self.fee))
+        self.update_pool_quantities(quantity_a, quantity_b)
+
+        # Supplies only depend on the totals exchanged in each direction
+        input_a, output_b = amounts[input_is_a].sum(), output_amounts[input_is_a].sum()
+        input_b, output_a = amounts[~input_is_a].sum(), output_amounts[~input_is_a].sum()
+        if input_a > 0:
+            self.update_supplies(self.token_a, self.token_b, float(input_a), float(output_b))
+        if input_b > 0:
+            self.update_supplies(self.token_b, self.token_a, float(input_b), float(output_a))
+
+        return output_amounts
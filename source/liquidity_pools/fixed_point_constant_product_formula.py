@@ -0,0 +1,134 @@
+from source.liquidity_pools.formula import Formula
+
+SCALE = 10 ** 9
+BPS_DENOMINATOR = 10_000
+
+
+def to_fixed_point(quantity):
+    """
+    Converts a token quantity to its integer representation scaled by SCALE.
+
+    Args:
+        quantity (float): The token quantity.
+
+    Returns:
+        int: The scaled integer quantity, rounded to the nearest unit.
+    """
+    return int(round(quantity * SCALE))
+
+
+def constant_product_out(amount_in, reserve_in, reserve_out, fee_bps=0):
+    """
+    Integer constant product swap: the output amount obtained for amount_in, rounded down.
+
+    Args:
+        amount_in (int): The scaled amount of the input token.
+        reserve_in (int): The scaled reserve of the input token.
+        reserve_out (int): The scaled reserve of the output token.
+        fee_bps (int): The fee retained by the pool, in basis points.
+
+    Returns:
+        int: The scaled amount of the output token.
+
+    Raises:
+        ValueError: If a positive amount_in would produce no output, which would let the pool take the
+                    input for free.
+    """
+    amount_in_after_fee = amount_in * (BPS_DENOMINATOR - fee_bps)
+    numerator = reserve_out * amount_in_after_fee
+    denominator = reserve_in * BPS_DENOMINATOR + amount_in_after_fee
+    amount_out = numerator // denominator
+    if amount_out == 0 and amount_in > 0:
+        raise ValueError("Swap output rounds down to zero.")
+    return amount_out
+
+
+def constant_product_in(amount_out, reserve_in, reserve_out, fee_bps=0):
+    """
+    Integer inverse constant product swap: the input amount required to obtain amount_out, rounded up.
+
+    Args:
+        amount_out (int): The scaled amount of the output token.
+        reserve_in (int): The scaled reserve of the input token.
+        reserve_out (int): The scaled reserve of the output token.
+        fee_bps (int): The fee retained by the pool, in basis points.
+
+    Returns:
+        int: The scaled amount of the input token.
+    """
+    numerator = reserve_in * amount_out * BPS_DENOMINATOR
+    denominator = (reserve_out - amount_out) * (BPS_DENOMINATOR - fee_bps)
+    return -(-numerator // denominator)
+
+
+class FixedPointConstantProductFormula(Formula):
+    """
+    Constant product formula evaluated with integer arithmetic on quantities scaled by SCALE.
+
+    Quantities are converted to scaled integers, the swap is computed exactly with integer multiplication and
+    floor division, and the result is converted back. Rounding always favours the pool (outputs are rounded down,
+    required inputs are rounded up), so long simulations do not accumulate floating point drift in the invariant.
+    Python integers are unbounded, so intermediate products cannot overflow.
+
+    Methods:
+        apply: Calculates the output token amount using the integer constant product formula.
+        inverse_apply: Calculates the input token amount required to obtain a given output amount.
+    """
+
+    __slots__ = ()
+
+    def apply(self, input_quantity, input_reserve, output_reserve):
+        """
+        Applies the integer constant product formula to calculate the output amount of a token swap.
+
+        Args:
+            input_quantity (float): The amount of the input token being swapped.
+            input_reserve (float): The current reserve of the input token in the pool.
+            output_reserve (float): The current reserve of the output token in the pool.
+
+        Returns:
+            float: The amount of the output token, rounded down to the fixed-point resolution.
+
+        Raises:
+            ValueError: If any of the arguments are not positive or if the input is too small to produce
+                        any output at the fixed-point resolution.
+        """
+        if input_quantity < 0:
+            raise ValueError("Input quantity must be positive.")
+        if input_reserve <= 0:
+            raise ValueError("Input reserve must be positive.")
+        if output_reserve <= 0:
+            raise ValueError("Output reserve must be positive.")
+
+        output_amount = constant_product_out(to_fixed_point(input_quantity), to_fixed_point(input_reserve),
+                                             to_fixed_point(output_reserve))
+        return output_amount / SCALE
+
+    def inverse_apply(self, output_quantity, input_reserve, output_reserve):
+        """
+        Calculates the input token amount required to achieve a desired output amount
+        using the integer constant product formula.
+
+        Args:
+            output_quantity (float): The desired amount of the output token to be swapped.
+            input_reserve (float): The current reserve of the input token in the pool.
+            output_reserve (float): The current reserve of the output token in the pool.
+
+        Returns:
+            float: The amount of the input token needed, rounded up to the fixed-point resolution.
+
+        Raises:
+            ValueError: If any of the arguments are not positive or if the output_quantity exceeds the output_reserve.
+        """
+        if output_quantity <= 0:
+            raise ValueError("Output quantity must be positive.")
+        if input_reserve <= 0:
+            raise ValueError("Input reserve must be positive.")
+        if output_reserve <= 0:
+            raise ValueError("Output reserve must be positive.")
+        if output_reserve - output_quantity <= 0:
+            raise ValueError("Output reserve must be positive after swapping.")
+
+        input_amount = constant_product_in(to_fixed_point(output_quantity), to_fixed_point(input_reserve),
+                                           to_fixed_point(output_reserve))
+        return input_amount / SCALE
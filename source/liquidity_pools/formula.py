@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 
 class Formula(ABC):
     """
@@ -9,9 +11,13 @@ class Formula(ABC):
     Methods:
         apply: An abstract method that calculates the swap amount based on input and output
                token quantities. Must be implemented by subclasses.
+        apply_unchecked: Same as apply, without argument validation.
+        apply_vec: Applies the formula element-wise over arrays of swaps.
         compute_reserve: An abstract method that calculates the reserve of a given token.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def apply(self, input_quantity, input_reserve, output_reserve):
         """
@@ -52,6 +58,44 @@ class Formula(ABC):
         """
         pass
 
+    def apply_unchecked(self, input_quantity, input_reserve, output_reserve):
+        """
+        Same as apply, for callers that have already validated the arguments.
+
+        The default implementation simply calls apply; subclasses can override it to skip the
+        argument validation on hot paths.
+
+        Args:
+            input_quantity (float): The amount of the input token to be swapped, not negative.
+            input_reserve (float): The current reserve of the input token in the pool, positive.
+            output_reserve (float): The current reserve of the output token in the pool, positive.
+
+        Returns:
+            float: The calculated amount of the output token after the swap.
+        """
+        return self.apply(input_quantity, input_reserve, output_reserve)
+
+    def apply_vec(self, input_quantities, input_reserves, output_reserves):
+        """
+        Calculates the output amounts of many independent swaps at once.
+
+        The default implementation calls apply for each element; subclasses with a closed-form
+        expression should override it with a NumPy implementation.
+
+        Args:
+            input_quantities (np.ndarray): The amounts of the input token to be swapped.
+            input_reserves (np.ndarray): The reserves of the input token, one per swap.
+            output_reserves (np.ndarray): The reserves of the output token, one per swap.
+
+        Returns:
+            np.ndarray: The calculated amount of the output token for each swap.
+        """
+        input_quantities, input_reserves, output_reserves = np.broadcast_arrays(input_quantities, input_reserves,
+                                                                                output_reserves)
+        return np.array([self.apply(q, ri, ro) for q, ri, ro in zip(input_quantities.ravel(), input_reserves.ravel(),
+                                                                     output_reserves.ravel())],
+                        dtype=np.float64).reshape(input_quantities.shape)
+
     def compute_reserve(self, input_reserve, output_reserve, new_input_reserve):
         """
         Calculates the current reserve of the other token in the pool with respect to input_reserve.
@@ -1,12 +1,87 @@
+from bisect import bisect_left
+
+import numpy as np
+
 from source.liquidity_pools.virtual_liquidity_pool import VirtualLiquidityPool
+from source.utils.jit import njit
+
+
+@njit(cache=True)
+def _shrink_kernel(buffer, head, active_length, new_length):
+    """
+    Shrinks the active range of the ring buffer to new_length, redistributing the excess sum across the
+    remaining values. new_length must not exceed the buffer size.
+
+    Returns:
+        int: The new active length.
+    """
+    if new_length >= active_length:
+        return new_length
+
+    capacity = buffer.shape[0]
+    # The tail has to be cleared anyway to keep inactive slots at zero, so its sum is accumulated in the same
+    # pass: this is exact and costs nothing extra, unlike a running total that would drift over long runs
+    excess_sum = 0.0
+    for i in range(new_length, active_length):
+        index = head + i
+        if index >= capacity:
+            index -= capacity
+        excess_sum += buffer[index]
+        buffer[index] = 0.0
+
+    distribute_amount = excess_sum / new_length
+    for i in range(new_length):
+        index = head + i
+        if index >= capacity:
+            index -= capacity
+        buffer[index] += distribute_amount
+    return new_length
+
+
+@njit(cache=True)
+def _spread_kernel(buffer, head, active_length, amount):
+    """
+    Adds amount in place to the active range of the ring buffer.
+    """
+    capacity = buffer.shape[0]
+    for i in range(active_length):
+        index = head + i
+        if index >= capacity:
+            index -= capacity
+        buffer[index] += amount
+
+
+@njit(cache=True)
+def _restore_kernel(buffer, head, active_length, new_length):
+    """
+    Performs a whole restore step on the ring buffer: shrinks the active range to new_length, then pops the
+    value at head and advances it.
+
+    Returns:
+        tuple: The restored value, the new head and the new active length.
+    """
+    active_length = _shrink_kernel(buffer, head, active_length, new_length)
+    restored_value = buffer[head]
+    buffer[head] = 0.0
+    head += 1
+    if head == buffer.shape[0]:
+        head = 0
+    return restored_value, head, active_length
 
 
 class ImprovedVirtualLiquidityPool(VirtualLiquidityPool):
     """
     Implements an enhanced virtual liquidity pool with a more sophisticated recovery system
     that includes restore_values to adjust delta dynamically.
+
+    restore_values is stored in a preallocated NumPy ring buffer: the logical element i lives at
+    _restore_buffer[(_head + i) % capacity] for i < _active_length, and every other slot is kept at zero.
+    Shifting, spreading and shrinking therefore never reallocate the buffer.
     """
 
+    __slots__ = ('_pool_recovery_period', '_restore_buffer', '_head', '_active_length', 'stablecoin_price', 'values',
+                 '_new_lengths')
+
     def __init__(self, stablecoin, collateral, stablecoin_base_quantity, fee, formula, pool_recovery_period):
         """
         Initializes the improved virtual liquidity pool with restore_values.
@@ -15,10 +90,55 @@ class ImprovedVirtualLiquidityPool(VirtualLiquidityPool):
             pool_recovery_period (int): The recovery period for the pool.
         """
         super().__init__(stablecoin, collateral, stablecoin_base_quantity, fee, formula)
-        self.pool_recovery_period = pool_recovery_period
-        self.restore_values = [0] * pool_recovery_period
         self.stablecoin_price = stablecoin.price
         self.values = [0.95 + i * 0.005 for i in range(9)]  # Thresholds: [0.95, 0.955, ..., 0.990]
+        self._restore_buffer = np.zeros(0, dtype=np.float64)
+        self._head = 0
+        self._active_length = 0
+        # The setter allocates the buffer, which then starts fully active
+        self.pool_recovery_period = pool_recovery_period
+        self._active_length = pool_recovery_period
+
+    @property
+    def pool_recovery_period(self):
+        return self._pool_recovery_period
+
+    @pool_recovery_period.setter
+    def pool_recovery_period(self, value):
+        if value <= 0:
+            raise ValueError("Pool recovery period must be positive.")
+        self._pool_recovery_period = value
+        # New restore_values length indexed by the number of thresholds strictly below the stablecoin price
+        self._new_lengths = [1] + [int(round(value * (1 - (i * 0.1)), 5)) for i in reversed(range(len(self.values)))]
+        # restore_values keeps its length until the next restore step, but the buffer must already fit the new period
+        if value > self._restore_buffer.size:
+            self._grow_restore_buffer(value)
+
+    @property
+    def restore_values(self):
+        """
+        Returns a copy of the logical restore_values, starting from the next value to be restored.
+
+        Returns:
+            np.ndarray: The active restore values.
+        """
+        capacity = self._restore_buffer.size
+        indices = (self._head + np.arange(self._active_length)) % capacity
+        return self._restore_buffer[indices]
+
+    @restore_values.setter
+    def restore_values(self, values):
+        """
+        Replaces restore_values with the provided sequence.
+
+        Args:
+            values (Sequence[float]): The new restore values, starting from the next value to be restored.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        self._restore_buffer = np.zeros(max(self.pool_recovery_period, values.size), dtype=np.float64)
+        self._restore_buffer[:values.size] = values
+        self._head = 0
+        self._active_length = values.size
 
     def restore_delta(self):
         """
@@ -27,43 +147,47 @@ class ImprovedVirtualLiquidityPool(VirtualLiquidityPool):
         """
 
         new_length = self.compute_restore_values_new_length()
+        if new_length > self._restore_buffer.size:
+            self._grow_restore_buffer(new_length)
 
-        # Shrink restore_values to the new length
-        self.shrink_restore_values(new_length)
-
-        # Update delta using the first value in restore_values and perform a circular shift
-        self.delta -= self.restore_values[0]
-        self.restore_values = self.restore_values[1:] + [0]  # Circular shift (left)
+        # Shrink restore_values to the new length, then restore the first value and perform a circular shift
+        restored_value, head, active_length = _restore_kernel(self._restore_buffer, self._head,
+                                                              self._active_length, new_length)
+        self.delta -= float(restored_value)
+        self._head = int(head)
+        self._active_length = int(active_length)
 
     def compute_restore_values_new_length(self):
-        new_length = 1
-        for i, val in enumerate(reversed(self.values)):
-            if self.stablecoin_price > val:
-                new_length = int(round(self.pool_recovery_period * (1 - (i * 0.1)), 5))
-                break
-        return new_length
+        return self._new_lengths[bisect_left(self.values, self.stablecoin_price)]
 
     def shrink_restore_values(self, new_length: int):
         """
         Shrinks restore_values to new_length by redistributing the excess sum across the first new_length elements.
 
         Args:
-            new_length (int): The new length for restore_values.
+            new_length (int): The new length for restore_values. NumPy integers are accepted as well.
         """
-        if new_length < 1 or type(new_length) != int:
+        if not isinstance(new_length, (int, np.integer)) or new_length < 1:
             raise ValueError("new_length must be an integer greater than or equal to 1")
 
-        if new_length >= len(self.restore_values):
-            self.restore_values += [0] * (new_length - len(self.restore_values))
-            return
+        if new_length > self._restore_buffer.size:
+            self._grow_restore_buffer(new_length)
 
-        excess_sum = sum(self.restore_values[new_length:])
-        self.restore_values = self.restore_values[:new_length]
+        # Slots outside the active range are always zero, so growing only moves the boundary
+        self._active_length = int(_shrink_kernel(self._restore_buffer, self._head, self._active_length, new_length))
 
-        # Redistribute excess sum across the reduced restore_values
-        if new_length > 0:
-            distribute_amount = excess_sum / new_length
-            self.restore_values = [val + distribute_amount for val in self.restore_values]
+    def _grow_restore_buffer(self, capacity):
+        """
+        Reallocates the ring buffer with the given larger capacity, moving the active values to its start.
+        The kernels never grow the buffer, so this must be called before any active length exceeds its size.
+
+        Args:
+            capacity (int): The new buffer size.
+        """
+        active_values = self.restore_values
+        self._restore_buffer = np.zeros(capacity, dtype=np.float64)
+        self._restore_buffer[:active_values.size] = active_values
+        self._head = 0
 
     def update_delta(self, delta_variation):
         """
@@ -73,15 +197,24 @@ class ImprovedVirtualLiquidityPool(VirtualLiquidityPool):
             delta_variation (float): The change to apply to delta.
         """
         self.delta += delta_variation
-        spread_amount = delta_variation / len(self.restore_values)
-        self.restore_values = [val + spread_amount for val in self.restore_values]
+        spread_amount = delta_variation / self._active_length
+        if self._active_length == self._restore_buffer.size:
+            # Spreading over the whole buffer does not depend on where the head is
+            np.add(self._restore_buffer, spread_amount, out=self._restore_buffer)
+        else:
+            _spread_kernel(self._restore_buffer, self._head, self._active_length, spread_amount)
 
     def reset_replenishing_system(self):
         """
         Resets delta to zero and reinitializes restore_values to zeros.
         """
         self.delta = 0
-        self.restore_values = [0] * self.pool_recovery_period
+        if self._restore_buffer.size == self.pool_recovery_period:
+            self._restore_buffer.fill(0.0)
+        else:
+            self._restore_buffer = np.zeros(self.pool_recovery_period, dtype=np.float64)
+        self._head = 0
+        self._active_length = self.pool_recovery_period
 
     def update_stablecoin_price(self, stablecoin_price):
         self.stablecoin_price = stablecoin_price
@@ -1,3 +1,8 @@
+from math import copysign
+
+import numpy as np
+
+
 class LiquidityPool:
     """
     Represents a liquidity pool for two tokens, facilitating swaps between them with a specified fee
@@ -13,10 +18,14 @@ class LiquidityPool:
 
     Methods:
         swap: Executes a swap between token_a and token_b, updating the pool quantities and applying the fee.
+        swap_batch: Executes a batch of independent swaps priced against the current pool quantities.
         compute_swap_value: Uses the formula to calculate the swap value based on current quantities,
                             adjusted for transaction fee.
     """
 
+    __slots__ = ('token_a', 'token_b', 'quantity_token_a', 'quantity_token_b', '_fee', '_one_minus_fee', '_formula',
+                 '_apply', '_inverse_apply')
+
     def __init__(self, token_a, token_b, quantity_token_a, quantity_token_b, fee, formula):
         """
         Initializes the LiquidityPool with two tokens, their quantities, a transaction fee,
@@ -37,6 +46,27 @@ class LiquidityPool:
         self.fee = fee
         self.formula = formula
 
+    @property
+    def fee(self):
+        return self._fee
+
+    @fee.setter
+    def fee(self, value):
+        self._fee = value
+        # Cached complement of the fee, used on every swap
+        self._one_minus_fee = 1 - value
+
+    @property
+    def formula(self):
+        return self._formula
+
+    @formula.setter
+    def formula(self, formula):
+        self._formula = formula
+        # Bound methods cached so that each swap does a single attribute load
+        self._apply = formula.apply_unchecked
+        self._inverse_apply = formula.inverse_apply
+
     def swap(self, token, amount):
         """
         Executes a swap between token_a and token_b, adjusting the pool quantities accordingly.
@@ -52,49 +82,82 @@ class LiquidityPool:
         Raises:
             ValueError: If the input token is not recognized.
         """
-        if token not in {self.token_a, self.token_b}:
+        is_token_a = token is self.token_a
+        if not is_token_a and token is not self.token_b:
             raise ValueError("Invalid input token for this liquidity pool.")
 
-        if token.is_equal(self.token_a):
-            if amount >= 0:
-                input_reserve, output_reserve = self.quantity_token_a, self.quantity_token_b
-            else:
-                input_reserve, output_reserve = self.quantity_token_b, self.quantity_token_a
+        # Reserves seen from the side of the provided token: "token" is the one passed in, "other" the counterpart
+        if is_token_a:
             other_token = self.token_b
+            token_reserve, other_reserve = self.quantity_token_a, self.quantity_token_b
         else:
-            if amount >= 0:
-                input_reserve, output_reserve = self.quantity_token_b, self.quantity_token_a
-            else:
-                input_reserve, output_reserve = self.quantity_token_a, self.quantity_token_b
             other_token = self.token_a
+            token_reserve, other_reserve = self.quantity_token_b, self.quantity_token_a
 
         if amount > 0:
-            input_amount = amount
-            output_amount = self.compute_swap_value(input_amount, input_reserve, output_reserve)
-            input_reserve += input_amount
-            output_reserve -= output_amount
-            other_amount = output_amount
-            if token.is_equal(self.token_a):
-                self.update_pool_quantities(input_reserve, output_reserve)
-            else:
-                self.update_pool_quantities(output_reserve, input_reserve)
+            other_amount = self.compute_swap_value(amount, token_reserve, other_reserve)
+            other_variation = -other_amount
         elif amount < 0:
-            output_amount = -amount
-            input_amount = self.compute_inverse_swap_value(output_amount, input_reserve, output_reserve)
-            input_reserve += input_amount
-            output_reserve -= output_amount
-            other_amount = input_amount
-            if token.is_equal(self.token_a):
-                self.update_pool_quantities(output_reserve, input_reserve)
-            else:
-                self.update_pool_quantities(input_reserve, output_reserve)
+            other_amount = self.compute_inverse_swap_value(-amount, other_reserve, token_reserve)
+            other_variation = other_amount
+        else:
+            other_amount = other_variation = 0
+
+        # The provided token reserve moves by amount, the other one by the output with the opposite sign
+        token_reserve += amount
+        other_reserve += other_variation
+        if is_token_a:
+            self.update_pool_quantities(token_reserve, other_reserve)
         else:
-            other_amount = 0
+            self.update_pool_quantities(other_reserve, token_reserve)
 
         self.update_supplies(token, other_token, amount, other_amount)
 
         return other_token, other_amount
 
+    def swap_batch(self, input_is_a, amounts):
+        """
+        Executes a batch of swaps in a single vectorized pass.
+
+        Every swap in the batch is priced against the pool quantities at the start of the batch (snapshot
+        semantics), then the net variation of both reserves is applied at once. For small trades relative
+        to the reserves this closely approximates executing the swaps one by one, at a fraction of the cost.
+
+        Args:
+            input_is_a (np.ndarray): Boolean array, True where the swap provides token_a to the pool
+                                     and False where it provides token_b.
+            amounts (np.ndarray): The positive amounts of the input tokens to swap.
+
+        Returns:
+            np.ndarray: The amount of output token obtained by each swap.
+
+        Raises:
+            ValueError: If the arrays have different shapes, if any amount is not positive or if the
+                        batch would drain a reserve.
+        """
+        input_is_a = np.asarray(input_is_a, dtype=bool)
+        amounts = np.asarray(amounts, dtype=np.float64)
+        if input_is_a.shape != amounts.shape:
+            raise ValueError("input_is_a and amounts must have the same shape.")
+        if np.any(amounts <= 0):
+            raise ValueError("Batch swap amounts must be positive.")
+
+        input_reserves = np.where(input_is_a, self.quantity_token_a, self.quantity_token_b)
+        output_reserves = np.where(input_is_a, self.quantity_token_b, self.quantity_token_a)
+        output_amounts = self.formula.apply_vec(amounts * self._one_minus_fee, input_reserves, output_reserves)
+
+        input_a, output_b = amounts[input_is_a].sum(), output_amounts[input_is_a].sum()
+        input_b, output_a = amounts[~input_is_a].sum(), output_amounts[~input_is_a].sum()
+        self.update_pool_quantities(self.quantity_token_a + input_a - output_a,
+                                    self.quantity_token_b + input_b - output_b)
+
+        if input_a > 0:
+            self.update_supplies(self.token_a, self.token_b, float(input_a), float(output_b))
+        if input_b > 0:
+            self.update_supplies(self.token_b, self.token_a, float(input_b), float(output_a))
+
+        return output_amounts
+
     def update_pool_quantities(self, new_quantity_token_a, new_quantity_token_b):
         if new_quantity_token_a < 0 or new_quantity_token_b < 0:
             raise ValueError("Token quantity in the pool cannot be negative.")
@@ -103,7 +166,8 @@ class LiquidityPool:
     def compute_swap_value(self, input_quantity, input_reserve, output_reserve):
         """
         Computes the amount of output token based on the input quantity, pool reserves,
-        and transaction fee.
+        and transaction fee. The formula is applied without argument validation, so callers must pass
+        a non-negative input quantity and positive reserves.
 
         Args:
             input_quantity (float): The amount of the input token being swapped.
@@ -114,10 +178,10 @@ class LiquidityPool:
             float: The computed amount of the output token after applying the fee.
         """
         # Apply the transaction fee
-        effective_input = input_quantity * (1 - self.fee)
+        effective_input = input_quantity * self._one_minus_fee
 
         # Use the provided formula to calculate swap amount
-        output_amount = self.formula.apply(effective_input, input_reserve, output_reserve)
+        output_amount = self._apply(effective_input, input_reserve, output_reserve)
 
         return output_amount
 
@@ -125,14 +189,15 @@ class LiquidityPool:
         """
         """
         # Use the provided formula to calculate swap amount
-        input_amount = self.formula.inverse_apply(output_quantity, input_reserve, output_reserve)
+        input_amount = self._inverse_apply(output_quantity, input_reserve, output_reserve)
 
         # Apply the transaction fee
-        effective_input = input_amount / (1 - self.fee)
+        effective_input = input_amount / self._one_minus_fee
 
         return effective_input
 
     def update_supplies(self, token, other_token, amount, other_amount):
         if amount != 0:
             token.free_supply -= amount
-            other_token.free_supply += other_amount * (amount / abs(amount))
+            # Same sign as amount: the other token leaves the pool when the token is added to it, and vice versa
+            other_token.free_supply += copysign(other_amount, amount)
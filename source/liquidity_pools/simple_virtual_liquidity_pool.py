@@ -7,6 +7,8 @@ class SimpleVirtualLiquidityPool(VirtualLiquidityPool):
     This is directly inspired by the original virtual liquidity pool implemented in the Terra protocol.
     """
 
+    __slots__ = ('_pool_recovery_period', '_decay')
+
     def __init__(self, stablecoin, collateral, stablecoin_base_quantity, fee, formula, pool_recovery_period):
         """
         Initializes the simple virtual liquidity pool with restore_values.
@@ -17,12 +19,34 @@ class SimpleVirtualLiquidityPool(VirtualLiquidityPool):
         super().__init__(stablecoin, collateral, stablecoin_base_quantity, fee, formula)
         self.pool_recovery_period = pool_recovery_period
 
+    @property
+    def pool_recovery_period(self):
+        return self._pool_recovery_period
+
+    @pool_recovery_period.setter
+    def pool_recovery_period(self, value):
+        if value <= 0:
+            raise ValueError("Pool recovery period must be positive.")
+        self._pool_recovery_period = value
+        # Cached decay factor, applied to delta on every restore
+        self._decay = 1 - 1 / value
+
     def restore_delta(self):
         """
         Reduces delta over time using an exponential decay formula:
         delta *= (1 - 1 / pool_recovery_period).
         """
-        self.delta *= (1 - 1 / self.pool_recovery_period)
+        self.delta *= self._decay
+
+    def restore_delta_steps(self, steps):
+        """
+        Applies restore_delta for several steps at once, e.g. to fast-forward a period without swaps:
+        delta *= (1 - 1 / pool_recovery_period) ** steps.
+
+        Args:
+            steps (int): The number of restore steps to apply.
+        """
+        self.delta *= self._decay ** steps
 
     def update_delta(self, delta_variation):
         """
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 from source.liquidity_pools.formula import Formula
 from source.liquidity_pools.liquidity_pool import LiquidityPool
 from source.tokens.seignorage_model_token import SeignorageModelToken
@@ -23,6 +25,8 @@ class VirtualLiquidityPool(LiquidityPool, ABC):
         update_token_b_price: Updates the price_token_b attribute with the provided value.
     """
 
+    __slots__ = ('stablecoin_base_quantity', 'collateral_price', 'delta')
+
     def __init__(self, stablecoin: Token, collateral: Token, stablecoin_base_quantity: float, fee: float,
                  formula: Formula):
         """
@@ -64,7 +68,7 @@ class VirtualLiquidityPool(LiquidityPool, ABC):
         self.quantity_token_b = self.stablecoin_base_quantity / self.collateral_price
         output_token, output_amount = super().swap(token, amount)
 
-        if token.is_equal(self.token_a):
+        if token is self.token_a:
             delta_variation = amount
         else:
             delta_variation = -output_amount
@@ -72,6 +76,29 @@ class VirtualLiquidityPool(LiquidityPool, ABC):
 
         return output_token, output_amount
 
+    def swap_batch(self, input_is_a, amounts):
+        """
+        Overrides swap_batch defined in LiquidityPool to include the delta dynamics.
+        The batch is priced against the virtual quantities derived from the current delta, and delta is then
+        updated with the net stablecoin variation of the whole batch.
+
+        Args:
+            input_is_a (np.ndarray): Boolean array, True where the swap provides the stablecoin.
+            amounts (np.ndarray): The positive amounts of the input tokens to swap.
+
+        Returns:
+            np.ndarray: The amount of output token obtained by each swap.
+        """
+        self.quantity_token_a = self.stablecoin_base_quantity + self.delta
+        self.quantity_token_b = self.stablecoin_base_quantity / self.collateral_price
+        output_amounts = super().swap_batch(input_is_a, amounts)
+
+        input_is_a = np.asarray(input_is_a, dtype=bool)
+        amounts = np.asarray(amounts, dtype=np.float64)
+        self.update_delta(float(amounts[input_is_a].sum() - output_amounts[~input_is_a].sum()))
+
+        return output_amounts
+
     def update_token_quantities(self):
         """
         Updates stablecoin and collateral quantities based on delta value.
@@ -0,0 +1,74 @@
+import numpy as np
+
+from source.utils.jit import njit, prange
+
+
+@njit(cache=True, parallel=True)
+def _run_sweep_kernel(fees, pool_recovery_periods, stablecoin_base_quantities, collateral_prices, inputs,
+                      delta_history):
+    for i in prange(fees.shape[0]):
+        one_minus_fee = 1.0 - fees[i]
+        decay = 1.0 - 1.0 / pool_recovery_periods[i]
+        quantity_collateral = stablecoin_base_quantities[i] / collateral_prices[i]
+        delta = 0.0
+        for t in range(inputs.shape[0]):
+            quantity_stablecoin = stablecoin_base_quantities[i] + delta
+            if quantity_stablecoin <= 0.0:
+                # The stablecoin reserve has been drained: the rest of the run is undefined
+                delta_history[i, t:] = np.nan
+                break
+
+            amount = inputs[t]
+            if amount > 0.0:
+                delta += amount
+            elif amount < 0.0:
+                effective_input = -amount * one_minus_fee
+                delta -= (quantity_stablecoin * effective_input) / (quantity_collateral + effective_input)
+
+            delta *= decay
+            delta_history[i, t] = delta
+
+
+def run_sweep(fees, pool_recovery_periods, stablecoin_base_quantities, collateral_prices, inputs):
+    """
+    Runs the virtual liquidity pool dynamics of SimpleVirtualLiquidityPool for many parameter sets in parallel.
+
+    Every parameter set i is an independent simulation fed with the same sequence of trades. At each step the
+    trade is swapped in the virtual pool (positive amounts provide stablecoin, negative amounts provide collateral)
+    and the pool is then replenished, exactly as swap followed by perform_pool_replenishing would do. The whole
+    sweep runs in a compiled kernel that touches no Python objects, so with Numba installed the parameter sets are
+    distributed across all cores.
+
+    Args:
+        fees (np.ndarray): The virtual pool fee of each parameter set.
+        pool_recovery_periods (np.ndarray): The recovery period of each parameter set.
+        stablecoin_base_quantities (np.ndarray): The stablecoin base quantity of each parameter set.
+        collateral_prices (np.ndarray): The collateral price of each parameter set, constant during the run.
+        inputs (np.ndarray): The signed trade amounts, one per step, shared by every parameter set.
+
+    Returns:
+        np.ndarray: Array of shape (number of parameter sets, number of steps) with the delta after each step.
+                    Steps following the depletion of the stablecoin reserve are NaN.
+
+    Raises:
+        ValueError: If the parameter arrays have different lengths or contain invalid values.
+    """
+    fees = np.ascontiguousarray(fees, dtype=np.float64)
+    pool_recovery_periods = np.ascontiguousarray(pool_recovery_periods, dtype=np.float64)
+    stablecoin_base_quantities = np.ascontiguousarray(stablecoin_base_quantities, dtype=np.float64)
+    collateral_prices = np.ascontiguousarray(collateral_prices, dtype=np.float64)
+    inputs = np.ascontiguousarray(inputs, dtype=np.float64)
+
+    if not (fees.shape == pool_recovery_periods.shape == stablecoin_base_quantities.shape == collateral_prices.shape):
+        raise ValueError("All parameter arrays must have the same length.")
+    if np.any(fees < 0) or np.any(fees >= 1):
+        raise ValueError("Fees must be in [0, 1).")
+    if np.any(pool_recovery_periods < 1):
+        raise ValueError("Pool recovery periods must be at least 1.")
+    if np.any(stablecoin_base_quantities <= 0) or np.any(collateral_prices <= 0):
+        raise ValueError("Base quantities and collateral prices must be positive.")
+
+    delta_history = np.zeros((fees.shape[0], inputs.shape[0]), dtype=np.float64)
+    _run_sweep_kernel(fees, pool_recovery_periods, stablecoin_base_quantities, collateral_prices, inputs,
+                      delta_history)
+    return delta_history
@@ -1,7 +1,8 @@
+import logging
 from source.gui.simulation_dashboard.build.gui_dashboard import GUIDashboard
 from source.gui.simulation_initialization.build.gui_param_initializer import GUIParamInitializer
-from source.liquidity_pools.constant_product_formula import ConstantProductFormula
-from source.liquidity_pools.liquidity_pool import LiquidityPool
+from source.liquidity_pools.constant_product_formula import CPF_INSTANCE
+from source.liquidity_pools.constant_product_liquidity_pool import ConstantProductLiquidityPool
 from source.liquidity_pools.simple_virtual_liquidity_pool import SimpleVirtualLiquidityPool
 from source.purchase_generators.seignorage_model_purchase_generator import SeignorageModelPurchaseGenerator
 from source.purchase_generators.seignorage_model_random_purchase_generator import SeignorageModelRandomPurchaseGenerator
@@ -11,6 +12,9 @@ from source.tokens.collateral_token import CollateralToken
 from source.tokens.reference_token import ReferenceToken
 from source.wallets_generators.exponential_wallets_generator import ExponentialWalletsGenerator
 
+# Arbitrage warnings are only useful when debugging; keep the simulation loop quiet
+logging.basicConfig(level=logging.ERROR)
+
 
 def validate_positive_number(value, param_name):
     """
@@ -75,7 +79,7 @@ try:
     collateral_pool_quantity = collateral_initial_supply - collateral_initial_free_supply
     collateral_pool_reference_quantity = collateral_pool_quantity * collateral_initial_price
 
-    cpf = ConstantProductFormula()
+    cpf = CPF_INSTANCE
 
     stablecoin_max_wallet_probability = 0.001
     collateral_max_wallet_probability = 0.001
@@ -98,19 +102,19 @@ try:
 
     reference = ReferenceToken(name="USD")
 
-    stablecoin_pool = LiquidityPool(token_a=stablecoin,
-                                    token_b=reference,
-                                    quantity_token_a=stablecoin_pool_quantity,
-                                    quantity_token_b=stablecoin_pool_reference_quantity,
-                                    formula=cpf,
-                                    fee=stablecoin_pool_fee)
-
-    collateral_pool = LiquidityPool(token_a=collateral,
-                                    token_b=reference,
-                                    quantity_token_a=collateral_pool_quantity,
-                                    quantity_token_b=collateral_pool_reference_quantity,
-                                    formula=cpf,
-                                    fee=collateral_pool_fee)
+    stablecoin_pool = ConstantProductLiquidityPool(token_a=stablecoin,
+                                                   token_b=reference,
+                                                   quantity_token_a=stablecoin_pool_quantity,
+                                                   quantity_token_b=stablecoin_pool_reference_quantity,
+                                                   formula=cpf,
+                                                   fee=stablecoin_pool_fee)
+
+    collateral_pool = ConstantProductLiquidityPool(token_a=collateral,
+                                                   token_b=reference,
+                                                   quantity_token_a=collateral_pool_quantity,
+                                                   quantity_token_b=collateral_pool_reference_quantity,
+                                                   formula=cpf,
+                                                   fee=collateral_pool_fee)
 
     virtual_pool = SimpleVirtualLiquidityPool(stablecoin=stablecoin,
                                               collateral=collateral,
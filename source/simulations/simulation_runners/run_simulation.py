@@ -1,6 +1,7 @@
+import logging
 import matplotlib.pyplot as plt
-from source.liquidity_pools.constant_product_formula import ConstantProductFormula
-from source.liquidity_pools.liquidity_pool import LiquidityPool
+from source.liquidity_pools.constant_product_formula import CPF_INSTANCE
+from source.liquidity_pools.constant_product_liquidity_pool import ConstantProductLiquidityPool
 from source.liquidity_pools.simple_virtual_liquidity_pool import SimpleVirtualLiquidityPool
 from source.purchase_generators.seignorage_model_random_purchase_generator import SeignorageModelRandomPurchaseGenerator
 from source.tokens.algorithmic_stablecoin import AlgorithmicStablecoin
@@ -8,6 +9,9 @@ from source.tokens.collateral_token import CollateralToken
 from source.tokens.reference_token import ReferenceToken
 from source.simulations.three_pools_simulation import ThreePoolsSimulation
 
+# Arbitrage warnings are only useful when debugging; keep the simulation loop quiet
+logging.basicConfig(level=logging.ERROR)
+
 
 try:
     number_of_iterations = 2000
@@ -26,7 +30,7 @@ try:
     vlp_pool_fee = 0.0
     pool_recovery_period = 200
 
-    cpf = ConstantProductFormula()
+    cpf = CPF_INSTANCE
 
     stablecoin = AlgorithmicStablecoin(name="AS",
                                        peg=1.0,
@@ -48,19 +52,19 @@ try:
     collateral_pool_quantity = collateral_initial_supply - collateral_initial_free_supply
     collateral_pool_reference_quantity = collateral_pool_quantity * collateral_initial_price
 
-    stablecoin_pool = LiquidityPool(token_a=stablecoin,
-                                    token_b=reference,
-                                    quantity_token_a=stablecoin_pool_quantity,
-                                    quantity_token_b=stablecoin_pool_reference_quantity,
-                                    formula=cpf,
-                                    fee=stablecoin_pool_fee)
-
-    collateral_pool = LiquidityPool(token_a=collateral,
-                                    token_b=reference,
-                                    quantity_token_a=collateral_pool_quantity,
-                                    quantity_token_b=collateral_pool_reference_quantity,
-                                    formula=cpf,
-                                    fee=collateral_pool_fee)
+    stablecoin_pool = ConstantProductLiquidityPool(token_a=stablecoin,
+                                                   token_b=reference,
+                                                   quantity_token_a=stablecoin_pool_quantity,
+                                                   quantity_token_b=stablecoin_pool_reference_quantity,
+                                                   formula=cpf,
+                                                   fee=stablecoin_pool_fee)
+
+    collateral_pool = ConstantProductLiquidityPool(token_a=collateral,
+                                                   token_b=reference,
+                                                   quantity_token_a=collateral_pool_quantity,
+                                                   quantity_token_b=collateral_pool_reference_quantity,
+                                                   formula=cpf,
+                                                   fee=collateral_pool_fee)
 
     virtual_pool = SimpleVirtualLiquidityPool(stablecoin=stablecoin,
                                               collateral=collateral,
@@ -1,7 +1,8 @@
+import logging
 import matplotlib.pyplot as plt
 import numpy as np
-from source.liquidity_pools.constant_product_formula import ConstantProductFormula
-from source.liquidity_pools.liquidity_pool import LiquidityPool
+from source.liquidity_pools.constant_product_formula import CPF_INSTANCE
+from source.liquidity_pools.constant_product_liquidity_pool import ConstantProductLiquidityPool
 from source.liquidity_pools.simple_virtual_liquidity_pool import SimpleVirtualLiquidityPool
 from source.purchase_generators.seignorage_model_purchase_generator import SeignorageModelPurchaseGenerator
 from source.tokens.algorithmic_stablecoin import AlgorithmicStablecoin
@@ -9,6 +10,9 @@ from source.tokens.collateral_token import CollateralToken
 from source.tokens.reference_token import ReferenceToken
 from source.simulations.three_pools_simulation import ThreePoolsSimulation
 
+# Arbitrage warnings are only useful when debugging; keep the simulation loop quiet
+logging.basicConfig(level=logging.ERROR)
+
 
 def calculate_volatility_array(volumes_daily, total_iterations_per_day, sqrt_2_pi=0.7979):
     volume_values_daily = [volume / total_iterations_per_day for volume in volumes_daily]
@@ -60,7 +64,7 @@ try:
     amount_mean_array_stablecoin[(8 * iterations_per_day):] = 0.2
     amount_mean_array_stablecoin = amount_mean_array_stablecoin.tolist()
 
-    cpf = ConstantProductFormula()
+    cpf = CPF_INSTANCE
 
     stablecoin = AlgorithmicStablecoin(name="AS",
                                        peg=1.0,
@@ -82,19 +86,19 @@ try:
     collateral_pool_quantity = collateral_initial_supply - collateral_initial_free_supply
     collateral_pool_reference_quantity = collateral_pool_quantity * collateral_initial_price
 
-    stablecoin_pool = LiquidityPool(token_a=stablecoin,
-                                    token_b=reference,
-                                    quantity_token_a=stablecoin_pool_quantity,
-                                    quantity_token_b=stablecoin_pool_reference_quantity,
-                                    formula=cpf,
-                                    fee=stablecoin_pool_fee)
-
-    collateral_pool = LiquidityPool(token_a=collateral,
-                                    token_b=reference,
-                                    quantity_token_a=collateral_pool_quantity,
-                                    quantity_token_b=collateral_pool_reference_quantity,
-                                    formula=cpf,
-                                    fee=collateral_pool_fee)
+    stablecoin_pool = ConstantProductLiquidityPool(token_a=stablecoin,
+                                                   token_b=reference,
+                                                   quantity_token_a=stablecoin_pool_quantity,
+                                                   quantity_token_b=stablecoin_pool_reference_quantity,
+                                                   formula=cpf,
+                                                   fee=stablecoin_pool_fee)
+
+    collateral_pool = ConstantProductLiquidityPool(token_a=collateral,
+                                                   token_b=reference,
+                                                   quantity_token_a=collateral_pool_quantity,
+                                                   quantity_token_b=collateral_pool_reference_quantity,
+                                                   formula=cpf,
+                                                   fee=collateral_pool_fee)
 
     virtual_pool = SimpleVirtualLiquidityPool(stablecoin=stablecoin,
                                               collateral=collateral,
@@ -1,7 +1,9 @@
 from source.liquidity_pools.liquidity_pool import LiquidityPool
 from source.liquidity_pools.virtual_liquidity_pool import VirtualLiquidityPool
+import queue
 import threading
 import time
+import numpy as np
 from source.purchase_generators.purchase_generator import PurchaseGenerator
 from source.simulations.three_pools_simulation import ThreePoolsSimulation
 from source.tokens.algorithmic_stablecoin import AlgorithmicStablecoin
@@ -20,7 +22,7 @@ class ThreePoolsLiveSimulation(ThreePoolsSimulation):
                  reference_token: ReferenceToken,
                  stablecoin_pool: LiquidityPool, collateral_pool: LiquidityPool, virtual_pool: VirtualLiquidityPool,
                  stablecoin_purchase_generator: PurchaseGenerator, collateral_purchase_generator: PurchaseGenerator,
-                 number_of_iterations: int = 0):
+                 number_of_iterations: int = 0, history_capacity: int = 10000):
         super().__init__(stablecoin_token, collateral_token, reference_token, stablecoin_pool, collateral_pool,
                          virtual_pool, stablecoin_purchase_generator, collateral_purchase_generator,
                          number_of_iterations)
@@ -30,9 +32,17 @@ class ThreePoolsLiveSimulation(ThreePoolsSimulation):
         self.stop_signal = False
         self.delay = 0.1
 
-        self.stablecoin_price_history = []
-        self.collateral_price_history = []
-        self.delta_variation_history = []
+        # Ring buffer with the stablecoin price, collateral price and VLP delta of the last history_capacity steps,
+        # one row each. Every value is written twice, at i and i + capacity, so the latest steps are always a
+        # contiguous slice and memory stays bounded however long the simulation runs.
+        if history_capacity < 1:
+            raise ValueError("The history capacity must be a positive integer.")
+        self.history_capacity = history_capacity
+        self._history = np.zeros((3, 2 * history_capacity), dtype=np.float64)
+        self._history_length = 0
+
+        self.snapshot_queue = None
+        self.snapshot_window = 0
 
     def run_simulation(self):
         """
@@ -51,7 +61,8 @@ class ThreePoolsLiveSimulation(ThreePoolsSimulation):
                 else:
                     time.sleep(1)
 
-        self.thread = threading.Thread(target=simulation_loop)
+        # Daemon thread, so that closing the dashboard does not wait for the simulation loop
+        self.thread = threading.Thread(target=simulation_loop, daemon=True)
         self.thread.start()
 
     def pause_simulation(self):
@@ -72,14 +83,78 @@ class ThreePoolsLiveSimulation(ThreePoolsSimulation):
         """
         Executes a single step of the simulation.
         """
-        self.stablecoin_price_history.append(self.stablecoin_token.price)
-        self.collateral_price_history.append(self.collateral_token.price)
-        self.delta_variation_history.append(self.virtual_pool.delta)
+        position = self._history_length % self.history_capacity
+        values = (self.stablecoin_token.price, self.collateral_token.price, self.virtual_pool.delta)
+        self._history[:, position] = values
+        self._history[:, position + self.history_capacity] = values
+        self._history_length += 1
         self.market_simulator.execute_random_purchases()
         self.number_of_iterations += 1
+        if self.snapshot_queue is not None:
+            self.publish_snapshot()
 
         print(f"Stablecoin Price: {self.stablecoin_token.price}, Collateral Price: {self.collateral_token.price}")
 
+    def _latest_history(self, count: int) -> np.ndarray:
+        """
+        Returns a (3, n) view of the values recorded in the latest n = min(count, retained steps) steps, oldest first.
+        """
+        length = self._history_length
+        if length == 0:
+            return self._history[:, :0]
+        end = (length - 1) % self.history_capacity + 1
+        if length > self.history_capacity:
+            end += self.history_capacity
+        return self._history[:, end - min(count, length, self.history_capacity):end]
+
+    @property
+    def stablecoin_price_history(self) -> np.ndarray:
+        """View of the stablecoin price recorded in the last history_capacity steps."""
+        return self._latest_history(self.history_capacity)[0]
+
+    @property
+    def collateral_price_history(self) -> np.ndarray:
+        """View of the collateral price recorded in the last history_capacity steps."""
+        return self._latest_history(self.history_capacity)[1]
+
+    @property
+    def delta_variation_history(self) -> np.ndarray:
+        """View of the virtual pool delta recorded in the last history_capacity steps."""
+        return self._latest_history(self.history_capacity)[2]
+
+    def set_snapshot_queue(self, snapshot_queue: queue.Queue, window: int):
+        """
+        Makes every simulation step publish a snapshot of the latest history to the given queue.
+
+        Args:
+            snapshot_queue (queue.Queue): The queue receiving the snapshots, typically bounded.
+            window (int): The number of latest iterations included in each snapshot.
+
+        Raises:
+            ValueError: If the window exceeds the history capacity.
+        """
+        if window > self.history_capacity:
+            raise ValueError("The snapshot window cannot exceed the history capacity.")
+        self.snapshot_queue = snapshot_queue
+        self.snapshot_window = window
+
+    def publish_snapshot(self):
+        """
+        Puts (iteration, stablecoin prices, collateral prices, deltas) of the latest iterations in the snapshot
+        queue. When the queue is full the oldest snapshot is dropped, since consumers only need the latest one.
+        The histories are copied, since the ring buffer overwrites old steps while the consumer reads them.
+        """
+        history = self._latest_history(self.snapshot_window).copy()
+        snapshot = (self.number_of_iterations, history[0], history[1], history[2])
+        try:
+            self.snapshot_queue.put_nowait(snapshot)
+        except queue.Full:
+            try:
+                self.snapshot_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self.snapshot_queue.put_nowait(snapshot)
+
     def add_custom_swap(self, token, quantity, pool):
         """
         Adds a custom swap immediately to the simulation.
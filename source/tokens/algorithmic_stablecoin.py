@@ -15,6 +15,8 @@ class AlgorithmicStablecoin(SeignorageModelToken):
         peg (float): The target price the stablecoin is pegged to (e.g., 1.0 USD).
     """
 
+    __slots__ = ('_peg', '_tied')
+
     def __init__(self, name: str, initial_supply: float, initial_free_supply: float, initial_price: float,
                  peg: float = 1.0):
         """
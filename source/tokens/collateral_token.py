@@ -11,11 +11,13 @@ class CollateralToken(SeignorageModelToken):
     Attributes:
         name (str): The name of the token.
         _supply (float): The current supply of the token.
-        _free_supply (float): The current free supply of the token.
+        free_supply (float): The current free supply of the token.
         _price (float): The current price of the token.
         _algorithmic_stablecoin (AlgorithmicStablecoin): The associated stablecoin.
     """
 
+    __slots__ = ('_algorithmic_stablecoin',)
+
     def __init__(self, name: str, initial_supply: float, initial_free_supply: float, initial_price: float,
                  algorithmic_stablecoin: AlgorithmicStablecoin):
         """
@@ -10,10 +10,12 @@ class GenericToken(Token):
     Attributes:
         name (str): The name of the GenericToken.
         _supply (float): The current supply of the token.
-        _free_supply (float): The amount of tokens present in users' wallets.
+        free_supply (float): The amount of tokens present in users' wallets.
         _price (float): The current price of the token.
     """
 
+    __slots__ = ()
+
     def __init__(self, name: str, initial_supply: float, initial_free_supply: float, initial_price: float):
         """
         Initializes the GenericToken instance with the provided name, supply, and price.
@@ -11,8 +11,10 @@ class ReferenceToken(Token):
         name (str): The name of the ReferenceToken.
         _price (float): Fixed price, always set to 1.0.
         _supply (float): Set to infinity to indicate that supply is undefined.
-        _free_supply (float): Set to infinity to indicate that free supply is undefined.
+        free_supply (float): Set to infinity to indicate that free supply is undefined.
     """
+
+    __slots__ = ()
     
     def __init__(self, name: str):
         """
@@ -1,8 +1,7 @@
-from abc import ABC, abstractmethod
 from source.tokens.token import Token
 
 
-class SeignorageModelToken(Token, ABC):
+class SeignorageModelToken(Token):
     """
     Represents a token within an algorithmic stablecoin model, such as the Terra/Luna model.
     This class allows for minting (increasing the supply) and burning (decreasing the supply) of tokens
@@ -14,10 +13,12 @@ class SeignorageModelToken(Token, ABC):
     Attributes:
         name (str): The name of the token.
         _supply (float): The current total supply of the token.
-        _free_supply (float): The amount of tokens present in users' wallets.
+        free_supply (float): The amount of tokens present in users' wallets.
         _price (float): The current price of the token.
     """
 
+    __slots__ = ()
+
     def __init__(self, name: str, initial_supply: float, initial_free_supply: float, initial_price: float):
         """
         Initializes the SeignorageModelToken with a given name, initial supply, initial_free_supply and price.
@@ -31,7 +32,12 @@ class SeignorageModelToken(Token, ABC):
             initial_free_supply (float): The initial free supply of the token.
             initial_price (float): The initial price of the token.
 
+        Raises:
+            TypeError: If SeignorageModelToken is instantiated directly.
         """
+        if type(self) is SeignorageModelToken:
+            raise TypeError("SeignorageModelToken is abstract and cannot be instantiated directly.")
+
         # Initialize the parent Token class
         super().__init__(name, initial_supply, initial_free_supply, initial_price)
 
@@ -69,10 +75,9 @@ class SeignorageModelToken(Token, ABC):
         # consistent with the change in the total supply.
         self.supply -= amount_to_burn
 
-    @abstractmethod
     def __repr__(self) -> str:
         """
         Abstract method to represent the SeignorageModelToken object as a string.
         Must be implemented by subclasses to provide a custom string representation.
         """
-        pass
+        raise NotImplementedError("SeignorageModelToken subclasses must implement __repr__.")
@@ -1,16 +1,17 @@
-from abc import ABC, abstractmethod
-
-
-class Token(ABC):
+class Token:
     """
     Abstract class representing a cryptocurrency.
+    Tokens compare by identity: == is the default object comparison, and internal code uses `is` directly.
     
     Attributes:
         name (str): The name of the token.
         _supply (float): The current total supply of the token.
-        _free_supply (float): The amount of tokens present in users' wallets.
+        free_supply (float): The amount of tokens present in users' wallets. It is a plain attribute, so internal
+                             updates skip validation; use set_free_supply_checked at input boundaries.
         _price (float): The current price of the token.
     """
+
+    __slots__ = ('name', '_supply', 'free_supply', '_price')
     
     def __init__(self, name: str, initial_supply: float, initial_free_supply: float, initial_price: float):
         """
@@ -27,28 +28,39 @@ class Token(ABC):
                                    Must be a positive number.
         
         Raises:
-            TypeError: If the name is not a string.
+            TypeError: If Token is instantiated directly or if the name is not a string.
             ValueError: If the initial supply is not a positive number, 
                         if the initial price is not a positive number,
                         or if initial_free_supply is greater than initial_supply.
         """
+        if type(self) is Token:
+            raise TypeError("Token is abstract and cannot be instantiated directly.")
+
         # Argument validation
-        if not isinstance(name, str):
+        # type() identity checks are the fast path for the exact builtins passed by the simulation; isinstance
+        # keeps accepting subclasses such as numpy.float64
+        if type(name) is not str and not isinstance(name, str):
             raise TypeError("The token name must be a string.")
-        if not isinstance(initial_supply, (int, float)) or initial_supply <= 0:
+        supply_type = type(initial_supply)
+        if (supply_type is not float and supply_type is not int and not isinstance(initial_supply, (int, float))
+                or initial_supply <= 0):
             raise ValueError("The initial supply must be a positive number.")
-        if not isinstance(initial_free_supply, (int, float)) or initial_free_supply < 0:
+        free_supply_type = type(initial_free_supply)
+        if (free_supply_type is not float and free_supply_type is not int
+                and not isinstance(initial_free_supply, (int, float)) or initial_free_supply < 0):
             raise ValueError("The initial free supply must be a positive number.")
         if initial_free_supply > initial_supply:
             raise ValueError("The initial free supply cannot exceed the initial supply.")
-        if not isinstance(initial_price, (float, int)) or initial_price <= 0:
+        price_type = type(initial_price)
+        if (price_type is not float and price_type is not int and not isinstance(initial_price, (float, int))
+                or initial_price <= 0):
             raise ValueError("The initial price must be a positive number.")
         
         # Initialize attributes.
         self.name = name
         # We use private attributes.
         self._supply = float(initial_supply)
-        self._free_supply = float(initial_free_supply)
+        self.free_supply = float(initial_free_supply)
         self._price = float(initial_price)  
 
     @property
@@ -56,11 +68,6 @@ class Token(ABC):
         """Getter for the total supply of tokens."""
         return self._supply
 
-    @property
-    def free_supply(self):
-        """Getter for the free supply of tokens."""
-        return self._free_supply
-    
     @property
     def price(self):
         """Getter for the price of the token."""
@@ -81,14 +88,15 @@ class Token(ABC):
                         would cause the free supply to become negative.
             TypeError: If the new_supply is not an integer.
         """
-        if not isinstance(new_supply, (float, int)):
+        supply_type = type(new_supply)
+        if supply_type is not float and supply_type is not int and not isinstance(new_supply, (float, int)):
             raise TypeError("Supply must be a numeric value.")
         
         if new_supply < 0:
             raise ValueError("Supply cannot be negative.")
         
         # Calculate the new free supply based on the difference in supply.
-        new_free_supply = self._free_supply + (new_supply - self._supply)
+        new_free_supply = self.free_supply + (new_supply - self._supply)
 
         if 0.001 > new_free_supply > -0.001:
             new_free_supply = 0
@@ -97,15 +105,15 @@ class Token(ABC):
             raise ValueError("Reduction in supply cannot result in negative free supply.")
 
         # Update the attributes
-        self._free_supply = float(new_free_supply)
+        self.free_supply = float(new_free_supply)
         self._supply = float(new_supply)
 
-    @free_supply.setter
-    def free_supply(self, new_free_supply: float):
+    def set_free_supply_checked(self, new_free_supply: float):
         """
-        Setter for the free supply of tokens with validation.
-        
-        Ensures that free_supply cannot exceed the total supply.
+        Sets the free supply of tokens with validation.
+
+        Ensures that free_supply cannot exceed the total supply. Internal updates assign free_supply directly;
+        this method is meant for values coming from outside the simulation.
         
         Args:
             new_free_supply (float): The new value for free_supply.
@@ -115,11 +123,13 @@ class Token(ABC):
         """
         if 0.01 > new_free_supply > -0.01:
             new_free_supply = 0
-        if not isinstance(new_free_supply, (float, int)) or new_free_supply < 0:
+        free_supply_type = type(new_free_supply)
+        if (free_supply_type is not float and free_supply_type is not int
+                and not isinstance(new_free_supply, (float, int)) or new_free_supply < 0):
             raise ValueError("Free supply must be a positive number.")
         if new_free_supply > self._supply:
             raise ValueError("Free supply cannot exceed total supply.")
-        self._free_supply = float(new_free_supply)
+        self.free_supply = float(new_free_supply)
 
     @price.setter
     def price(self, new_price: float):
@@ -137,19 +147,6 @@ class Token(ABC):
         else:
             raise ValueError("Invalid price. The price must be a positive number.")
 
-    def is_equal(self, other_token) -> bool:
-        """
-        Checks if two tokens are the same object (instance identity).
-        
-        Args:
-            other_token (Token): Another token object to compare.
-        
-        Returns:
-            bool: True if the two tokens are the same object, False otherwise.
-        """
-        return self is other_token
-
-    @abstractmethod
     def __repr__(self) -> str:
         """
         Abstract method for representing the token as a string.
@@ -157,5 +154,8 @@ class Token(ABC):
         
         Returns:
             str: The textual representation of the token.
+
+        Raises:
+            NotImplementedError: If the subclass does not implement it.
         """
-        pass
+        raise NotImplementedError("Token subclasses must implement __repr__.")
@@ -0,0 +1,26 @@
+"""
+Optional Numba support for the numerical kernels of the simulator.
+
+When Numba is installed, njit and prange are re-exported from it. Otherwise njit returns the decorated
+function unchanged and prange falls back to range, so every kernel still runs, only without compilation.
+"""
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """
+        No-op replacement for numba.njit, usable both as @njit and as @njit(...).
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(function):
+            return function
+
+        return decorator
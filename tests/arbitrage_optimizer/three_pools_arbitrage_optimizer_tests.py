@@ -1,14 +1,27 @@
 import unittest
 from unittest.mock import patch
+import numpy as np
+from scipy.optimize import minimize_scalar
 from source.liquidity_pools.constant_product_formula import ConstantProductFormula
+from source.liquidity_pools.formula import Formula
 from source.liquidity_pools.liquidity_pool import LiquidityPool
 from source.liquidity_pools.simple_virtual_liquidity_pool import SimpleVirtualLiquidityPool
 from source.tokens.algorithmic_stablecoin import AlgorithmicStablecoin
 from source.tokens.collateral_token import CollateralToken
-from source.arbitrage_optimizer.three_pools_arbitrage_optimizer import ThreePoolsArbitrageOptimizer
+from source.arbitrage_optimizer.three_pools_arbitrage_optimizer import ARB_T1, ARB_T2, ThreePoolsArbitrageOptimizer
 from source.tokens.reference_token import ReferenceToken
 
 
+class DelegatingFormula(Formula):
+    """Constant product formula behind a generic Formula, forcing the numerical optimization path."""
+
+    def apply(self, input_quantity, input_reserve, output_reserve):
+        return ConstantProductFormula.apply(input_quantity, input_reserve, output_reserve)
+
+    def inverse_apply(self, output_quantity, input_reserve, output_reserve):
+        return ConstantProductFormula.inverse_apply(output_quantity, input_reserve, output_reserve)
+
+
 class TestThreePoolsArbitrageOptimizer(unittest.TestCase):
     def setUp(self):
         # LiquidityPool instances
@@ -22,18 +35,19 @@ class TestThreePoolsArbitrageOptimizer(unittest.TestCase):
         self.virtual_pool_base_quantity = 100000000
         self.pools_initialization()
 
-    def pools_initialization(self):
+    def pools_initialization(self, formula=None):
+        formula = formula or ConstantProductFormula()
         self.pool1 = LiquidityPool(self.stablecoin, self.reference_token,
                                    self.pool_initial_token_quantity/self.stablecoin.price,
                                    self.pool_initial_token_quantity,
-                                   0, ConstantProductFormula())
+                                   0, formula)
         self.pool2 = LiquidityPool(self.collateral, self.reference_token,
                                    self.pool_initial_token_quantity/self.collateral.price,
                                    self.pool_initial_token_quantity,
-                                   0, ConstantProductFormula())
+                                   0, formula)
         self.virtual_pool = SimpleVirtualLiquidityPool(self.stablecoin, self.collateral,
                                                        self.virtual_pool_base_quantity,
-                                                       0, ConstantProductFormula(),
+                                                       0, formula,
                                                        pool_recovery_period=10)
         # Initialize optimizer
         self.optimizer = ThreePoolsArbitrageOptimizer(
@@ -57,7 +71,7 @@ class TestThreePoolsArbitrageOptimizer(unittest.TestCase):
 
         arbitrage_type, exists = self.optimizer.detect_arbitrage()
         self.assertFalse(exists)
-        self.assertEqual(arbitrage_type, '')
+        self.assertIsNone(arbitrage_type)
 
     def test_detect_arbitrage_type1(self):
         """Test detect_arbitrage detects Type 1 arbitrage."""
@@ -68,7 +82,7 @@ class TestThreePoolsArbitrageOptimizer(unittest.TestCase):
 
         arbitrage_type, exists = self.optimizer.detect_arbitrage()
         self.assertTrue(exists)
-        self.assertEqual(arbitrage_type, 'Type 1')
+        self.assertEqual(arbitrage_type, ARB_T1)
 
     def test_detect_arbitrage_type2(self):
         """Test detect_arbitrage detects Type 2 arbitrage."""
@@ -79,25 +93,97 @@ class TestThreePoolsArbitrageOptimizer(unittest.TestCase):
 
         arbitrage_type, exists = self.optimizer.detect_arbitrage()
         self.assertTrue(exists)
-        self.assertEqual(arbitrage_type, 'Type 2')
+        self.assertEqual(arbitrage_type, ARB_T2)
+
+    def test_detect_arbitrage_cache(self):
+        """Test that detect_arbitrage reuses its result until a pool reserve changes."""
+        self.stablecoin.price = 1.2
+        self.pools_initialization()
+
+        with patch.object(self.optimizer, 'get_arbitrage_profit', wraps=self.optimizer.get_arbitrage_profit) as probe:
+            first = self.optimizer.detect_arbitrage()
+            probes = probe.call_count
+            self.assertEqual(self.optimizer.detect_arbitrage(), first)
+            self.assertEqual(probe.call_count, probes)
+
+            self.pool1.swap(self.pool1.token_a, 1000)
+            self.optimizer.detect_arbitrage()
+            self.assertGreater(probe.call_count, probes)
 
     @patch('source.arbitrage_optimizer.three_pools_arbitrage_optimizer.minimize_scalar')
     def test_compute_max_arbitrage_profit_success(self, mock_minimize):
         """Test compute_max_arbitrage_profit when optimization is successful."""
+        self.pools_initialization(DelegatingFormula())
         mock_minimize.return_value.success = True
         mock_minimize.return_value.x = 50.0
+        mock_minimize.return_value.fun = -1.0
 
-        result = self.optimizer.compute_max_arbitrage_profit("Type 1")
+        result = self.optimizer.compute_max_arbitrage_profit(ARB_T1)
         self.assertEqual(result, 50.0)
         mock_minimize.assert_called_once()
 
     @patch('source.arbitrage_optimizer.three_pools_arbitrage_optimizer.minimize_scalar')
     def test_compute_max_arbitrage_profit_failure(self, mock_minimize):
         """Test compute_max_arbitrage_profit when optimization fails."""
+        self.pools_initialization(DelegatingFormula())
         mock_minimize.return_value.success = False
 
         with self.assertRaises(ValueError):
-            self.optimizer.compute_max_arbitrage_profit("Type 1")
+            self.optimizer.compute_max_arbitrage_profit(ARB_T1)
+
+    @patch('source.arbitrage_optimizer.three_pools_arbitrage_optimizer.minimize_scalar')
+    def test_compute_max_arbitrage_profit_closed_form(self, mock_minimize):
+        """Test that constant product pools use the closed form optimum, matching the numerical one."""
+        self.stablecoin.price = 1.2
+        self.pools_initialization()
+        for pool in (self.pool1, self.pool2, self.virtual_pool):
+            pool.fee = 0.003
+
+        for arbitrage_type in (ARB_T1, ARB_T2):
+            with self.subTest(arbitrage_type):
+                result = self.optimizer.compute_max_arbitrage_profit(arbitrage_type)
+                numerical = minimize_scalar(lambda q: -self.optimizer.get_arbitrage_profit(arbitrage_type, q),
+                                            bounds=(1, self.optimizer.max_arbitrage_input), method='bounded')
+                self.assertGreaterEqual(self.optimizer.get_arbitrage_profit(arbitrage_type, result),
+                                        -numerical.fun - 1e-6)
+        mock_minimize.assert_not_called()
+
+    def test_detect_arbitrage_batch(self):
+        """Test that detect_arbitrage_batch matches detect_arbitrage and compute_max_arbitrage_profit per row."""
+        for pool in (self.pool1, self.pool2, self.virtual_pool):
+            pool.fee = 0.003
+        states = np.array([
+            [5e5, 5e5, 1e5, 5e5, 1e8, 2e7],
+            [5e5 / 1.2, 5e5, 1e5, 5e5, 1e8, 2e7],
+            [5e5 / 0.8, 5e5, 1e5, 5e5, 1e8, 2e7],
+            [5e5, 5e5, 1e5 / 1.1, 5e5, 1e8, 2e7],
+        ])
+
+        result = self.optimizer.detect_arbitrage_batch(states)
+
+        self.assertEqual(result.shape, (len(states),))
+        for row, state in enumerate(states):
+            (self.pool1.quantity_token_a, self.pool1.quantity_token_b, self.pool2.quantity_token_a,
+             self.pool2.quantity_token_b, self.virtual_pool.quantity_token_a,
+             self.virtual_pool.quantity_token_b) = state
+            arbitrage_type, is_arbitrage = self.optimizer.detect_arbitrage()
+            expected = 0.0
+            if is_arbitrage:
+                expected = min(self.optimizer.compute_max_arbitrage_profit(arbitrage_type),
+                               self.optimizer.max_arbitrage_input)
+                expected = expected if arbitrage_type == ARB_T1 else -expected
+            self.assertAlmostEqual(result[row], expected, places=6)
+        self.assertEqual(result[0], 0)
+        self.assertGreater(result[1], 0)
+        self.assertLess(result[2], 0)
+
+    def test_detect_arbitrage_batch_invalid(self):
+        """Test that detect_arbitrage_batch rejects malformed states and non constant product pools."""
+        with self.assertRaises(ValueError):
+            self.optimizer.detect_arbitrage_batch(np.ones((3, 5)))
+        self.pools_initialization(DelegatingFormula())
+        with self.assertRaises(ValueError):
+            self.optimizer.detect_arbitrage_batch(np.ones((3, 6)))
 
     def test_get_arbitrage_profit_type1(self):
         """Test get_arbitrage_profit for Type 1 arbitrage."""
@@ -105,7 +191,7 @@ class TestThreePoolsArbitrageOptimizer(unittest.TestCase):
         self.pool2.token_a.price = 5.0
         self.pools_initialization()
 
-        profit = self.optimizer.get_arbitrage_profit("Type 1", 1.0)
+        profit = self.optimizer.get_arbitrage_profit(ARB_T1, 1.0)
         self.assertAlmostEqual(profit, 0.2, places=2)
 
     def test_get_arbitrage_profit_type2(self):
@@ -114,12 +200,12 @@ class TestThreePoolsArbitrageOptimizer(unittest.TestCase):
         self.pool2.token_a.price = 5.0
         self.pools_initialization()
 
-        profit = self.optimizer.get_arbitrage_profit("Type 2", 1.0)
+        profit = self.optimizer.get_arbitrage_profit(ARB_T2, 1.0)
         self.assertAlmostEqual(profit, 0.25, places=2)
 
     def test_get_arbitrage_profit_no_input(self):
         """Test get_arbitrage_profit when input quantity is zero."""
-        profit = self.optimizer.get_arbitrage_profit("Type 1", 0.0)
+        profit = self.optimizer.get_arbitrage_profit(ARB_T1, 0.0)
         self.assertEqual(profit, 0)
 
     def test_leverage_arbitrage_opportunity_type1(self):
@@ -0,0 +1,73 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+import numpy as np
+from source.gui.simulation_dashboard.build.gui_dashboard import GUIDashboard
+
+
+class TestGUIDashboardDecimation(unittest.TestCase):
+    def test_short_series_unchanged(self):
+        """Test that a series with at most two points per bucket is returned as it is"""
+        x = np.arange(100.0)
+        y = np.sin(x)
+
+        decimated_x, decimated_y = GUIDashboard._decimate(x, y, buckets=50)
+
+        self.assertIs(decimated_x, x)
+        self.assertIs(decimated_y, y)
+
+    def test_long_series_keeps_extent_and_extremes(self):
+        """Test that decimation keeps the first and last points and every bucket extreme, whatever the remainder"""
+        for length in (1439, 2000, 2001):
+            with self.subTest(length=length):
+                x = np.arange(length, dtype=float)
+                y = np.random.default_rng(length).normal(size=length)
+                # Spikes at both ends, where a dropped remainder would lose them
+                y[1] = 50.0
+                y[-2] = -50.0
+
+                decimated_x, decimated_y = GUIDashboard._decimate(x, y, buckets=480)
+
+                self.assertEqual(decimated_x[0], 0.0)
+                self.assertEqual(decimated_x[-1], length - 1)
+                self.assertTrue(np.all(np.diff(decimated_x) > 0))
+                self.assertEqual(decimated_y.max(), 50.0)
+                self.assertEqual(decimated_y.min(), -50.0)
+                np.testing.assert_array_equal(decimated_y, y[decimated_x.astype(int)])
+                self.assertLessEqual(len(decimated_x), 2 * 480 + 2)
+
+
+
+class TestGUIDashboardScheduling(unittest.TestCase):
+    def setUp(self):
+        """Creates a dashboard bound to a mock Tk root, without building any widget"""
+        self.dashboard = GUIDashboard.__new__(GUIDashboard)
+        self.root = MagicMock()
+        self.dashboard.root = self.root
+        self.dashboard._after_id = None
+
+    def test_run_cancels_pending_update(self):
+        """Test that running again cancels the pending update, so that a single update chain is scheduled"""
+        self.dashboard._after_id = "after#1"
+
+        with patch.object(GUIDashboard, "update_graphs") as update_graphs:
+            self.dashboard.run()
+
+        self.root.after_cancel.assert_called_once_with("after#1")
+        update_graphs.assert_called_once_with(self.root)
+        self.root.mainloop.assert_called_once_with()
+
+    def test_destroy_forgets_root(self):
+        """Test that destroying the root, but not one of its children, resets the root and the pending update"""
+        self.dashboard._after_id = "after#1"
+
+        self.dashboard._on_destroy(SimpleNamespace(widget=MagicMock()))
+        self.assertIs(self.dashboard.root, self.root)
+
+        self.dashboard._on_destroy(SimpleNamespace(widget=self.root))
+        self.assertIsNone(self.dashboard.root)
+        self.assertIsNone(self.dashboard._after_id)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+from source.liquidity_pools.constant_product_formula import ConstantProductFormula
+from source.liquidity_pools.fixed_point_constant_product_formula import (FixedPointConstantProductFormula,
+                                                                         constant_product_out, SCALE)
+
+
+class TestFixedPointConstantProductFormula(unittest.TestCase):
+    def setUp(self):
+        self.formula = FixedPointConstantProductFormula()
+        self.float_formula = ConstantProductFormula()
+
+    def test_apply_matches_float_formula(self):
+        """Test that the integer formula agrees with the float formula within the fixed-point resolution"""
+        cases = [(100.0, 1000.0, 1000.0), (0.5, 25000.0, 5000.0), (12345.678, 1e6, 2e5)]
+        for input_quantity, input_reserve, output_reserve in cases:
+            with self.subTest(f"Testing apply with {input_quantity}, {input_reserve}, {output_reserve}"):
+                expected = self.float_formula.apply(input_quantity, input_reserve, output_reserve)
+                result = self.formula.apply(input_quantity, input_reserve, output_reserve)
+                self.assertLessEqual(result, expected)
+                self.assertAlmostEqual(result, expected, delta=2 / SCALE)
+
+    def test_inverse_apply_rounds_up(self):
+        """Test that the required input is never below the float formula result"""
+        expected = self.float_formula.inverse_apply(50.0, 1000.0, 1000.0)
+        result = self.formula.inverse_apply(50.0, 1000.0, 1000.0)
+        self.assertGreaterEqual(result, expected)
+        self.assertAlmostEqual(result, expected, delta=2 / SCALE)
+
+    def test_constant_product_out_with_fee(self):
+        """Test the integer kernel with the fee expressed in basis points"""
+        self.assertEqual(constant_product_out(100, 1000, 1000, fee_bps=0), 90)
+        self.assertEqual(constant_product_out(100, 1000, 1000, fee_bps=30), 90)
+        self.assertEqual(constant_product_out(1000, 1000, 1000, fee_bps=30), 499)
+
+    def test_invalid_inputs(self):
+        """Test error handling for invalid arguments"""
+        with self.assertRaises(ValueError):
+            self.formula.apply(-1.0, 1000.0, 1000.0)
+        with self.assertRaises(ValueError):
+            self.formula.inverse_apply(1000.0, 1000.0, 1000.0)
+
+    def test_zero_output_swap(self):
+        """Test that a swap too small to produce any output is rejected instead of returning zero"""
+        self.assertEqual(self.formula.apply(0.0, 1000.0, 1000.0), 0.0)
+        with self.assertRaises(ValueError):
+            self.formula.apply(1e-9, 1e6, 1.0)
+        with self.assertRaises(ValueError):
+            constant_product_out(1, 10 ** 6, 10 ** 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,7 @@
 import unittest
-from source.liquidity_pools.constant_product_formula import ConstantProductFormula
+import numpy as np
+from source.liquidity_pools.constant_product_formula import ConstantProductFormula, batch_swap, sequential_swap
+from source.liquidity_pools.constant_product_liquidity_pool import ConstantProductLiquidityPool
 from source.liquidity_pools.liquidity_pool import LiquidityPool
 from source.tokens.generic_token import GenericToken
 
@@ -135,6 +137,84 @@ class TestLiquidityPool(unittest.TestCase):
                 with self.assertRaises(ValueError):
                     pool.swap(token, amount)
 
+    def test_batch_swap(self):
+        """Test that batch_swap matches the scalar swap computation element by element"""
+        input_quantities = np.array([0.0, 1.0, 100.0, 5000.0])
+        input_reserves = np.array([1000.0, 1000.0, 2000.0, 1000.0])
+        output_reserves = np.array([1000.0, 500.0, 1000.0, 3000.0])
+
+        output_amounts = batch_swap(input_quantities, input_reserves, output_reserves, self.standard_fee)
+
+        for i in range(len(input_quantities)):
+            pool = self.create_pool(input_reserves[i], output_reserves[i], self.standard_fee)
+            expected_output = pool.compute_swap_value(input_quantities[i], input_reserves[i], output_reserves[i])
+            self.assertAlmostEqual(output_amounts[i], expected_output, places=9)
+
+        with self.assertRaises(ValueError):
+            batch_swap(np.array([-1.0]), np.array([1000.0]), np.array([1000.0]), self.standard_fee)
+
+    def test_swap_batch(self):
+        """Test that a batch of swaps is priced against the initial reserves and applied at once"""
+        pool = self.create_pool(1000.0, 2000.0, self.standard_fee)
+        input_is_a = np.array([True, False, True])
+        amounts = np.array([10.0, 30.0, 5.0])
+
+        output_amounts = pool.swap_batch(input_is_a, amounts)
+
+        for i in range(len(amounts)):
+            reference_pool = self.create_pool(1000.0, 2000.0, self.standard_fee)
+            token = self.token_a if input_is_a[i] else self.token_b
+            _, expected_output = reference_pool.swap(token, amounts[i])
+            self.assertAlmostEqual(output_amounts[i], expected_output, places=9)
+
+        self.assertAlmostEqual(pool.quantity_token_a, 1000.0 + 15.0 - output_amounts[1], places=9)
+        self.assertAlmostEqual(pool.quantity_token_b, 2000.0 + 30.0 - output_amounts[0] - output_amounts[2],
+                               places=9)
+
+        with self.assertRaises(ValueError):
+            pool.swap_batch(np.array([True]), np.array([0.0]))
+
+    def test_constant_product_liquidity_pool(self):
+        """Test that the specialized pool gives the same results as the generic pool with the same formula"""
+        pool = self.create_pool(1000.0, 2000.0, self.standard_fee)
+        specialized_pool = ConstantProductLiquidityPool(self.token_a, self.token_b, 1000.0, 2000.0,
+                                                        self.standard_fee)
+
+        for token, amount in [(self.token_a, 100.0), (self.token_b, 250.0), (self.token_a, -30.0), (self.token_b, -5.0)]:
+            with self.subTest(f"Testing swap: {token.__repr__()}, {amount}"):
+                _, expected_amount = pool.swap(token, amount)
+                _, obtained_amount = specialized_pool.swap(token, amount)
+                self.assertAlmostEqual(obtained_amount, expected_amount, places=9)
+                self.assertAlmostEqual(specialized_pool.quantity_token_a, pool.quantity_token_a, places=9)
+                self.assertAlmostEqual(specialized_pool.quantity_token_b, pool.quantity_token_b, places=9)
+
+    def test_swap_sequence(self):
+        """Test that a sequence of swaps matches calling swap for each element in order"""
+        input_is_a = np.array([True, False, True, True])
+        amounts = np.array([10.0, 30.0, 5.0, 250.0])
+        pool = ConstantProductLiquidityPool(self.token_a, self.token_b, 1000.0, 2000.0, self.standard_fee)
+        # The reference run uses its own tokens, so that the free supplies of the two runs can be compared
+        reference_token_a = GenericToken("TOKENA", 100000, 5000, 1)
+        reference_token_b = GenericToken("TOKENB", 100000, 5000, 5)
+        reference_pool = LiquidityPool(reference_token_a, reference_token_b, 1000.0, 2000.0, self.standard_fee,
+                                       self.formula)
+
+        output_amounts = pool.swap_sequence(input_is_a, amounts)
+
+        for i in range(len(amounts)):
+            token = reference_token_a if input_is_a[i] else reference_token_b
+            _, expected_output = reference_pool.swap(token, amounts[i])
+            self.assertAlmostEqual(output_amounts[i], expected_output, places=9)
+        self.assertAlmostEqual(pool.quantity_token_a, reference_pool.quantity_token_a, places=9)
+        self.assertAlmostEqual(pool.quantity_token_b, reference_pool.quantity_token_b, places=9)
+        self.assertAlmostEqual(self.token_a.free_supply, reference_token_a.free_supply, places=9)
+        self.assertAlmostEqual(self.token_b.free_supply, reference_token_b.free_supply, places=9)
+
+        with self.assertRaises(ValueError):
+            pool.swap_sequence(np.array([True]), np.array([-1.0]))
+        with self.assertRaises(ValueError):
+            sequential_swap(np.array([True]), np.array([1.0]), 0.0, 1000.0, self.standard_fee)
+
 
 if __name__ == '__main__':
     unittest.main()
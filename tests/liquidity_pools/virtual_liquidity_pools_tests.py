@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 from source.liquidity_pools.constant_product_formula import ConstantProductFormula
 from source.liquidity_pools.improved_virtual_liquidity_pool import ImprovedVirtualLiquidityPool
 from source.liquidity_pools.simple_virtual_liquidity_pool import SimpleVirtualLiquidityPool
@@ -11,8 +12,8 @@ class TestSimpleVirtualLiquidityPool(unittest.TestCase):
         """
         Initialize a test instance of SimpleVirtualLiquidityPool with valid values.
         """
-        stablecoin = AlgorithmicStablecoin("Stablecoin", 1000000, 1.0)
-        collateral = CollateralToken("Collateral", 1000000, 5.0)
+        stablecoin = AlgorithmicStablecoin("Stablecoin", 1000000, 1000000, 1.0)
+        collateral = CollateralToken("Collateral", 1000000, 1000000, 5.0, stablecoin)
         formula = ConstantProductFormula()
 
         self.pool = SimpleVirtualLiquidityPool(
@@ -49,6 +50,21 @@ class TestSimpleVirtualLiquidityPool(unittest.TestCase):
         expected_delta = 1e6 * (1 - 1 / self.pool.pool_recovery_period)
         self.assertAlmostEqual(self.pool.delta, expected_delta, places=5)
 
+    def test_restore_delta_steps(self):
+        """
+        Test restore_delta_steps matches repeated calls of restore_delta.
+        """
+        self.pool.delta = 100.0
+        self.pool.restore_delta_steps(5)
+        expected_delta = 100.0
+        for _ in range(5):
+            expected_delta *= (1 - 1 / self.pool.pool_recovery_period)
+        self.assertAlmostEqual(self.pool.delta, expected_delta, places=9)
+
+        self.pool.pool_recovery_period = 4
+        self.pool.restore_delta()
+        self.assertAlmostEqual(self.pool.delta, expected_delta * 0.75, places=9)
+
     def test_update_delta_increase(self):
         """
         Test update_delta increases delta by the specified variation.
@@ -76,15 +92,33 @@ class TestSimpleVirtualLiquidityPool(unittest.TestCase):
         Ensure invalid inputs for collateral_price raise exceptions.
         """
         with self.assertRaises(ValueError):
+            stablecoin = AlgorithmicStablecoin("Stablecoin", 1000000, 1000000, 1.0)
             SimpleVirtualLiquidityPool(
-                stablecoin=AlgorithmicStablecoin("Stablecoin", 1000000, 1.0),
-                collateral=CollateralToken("Collateral", 1000000, 5.0),
+                stablecoin=stablecoin,
+                collateral=CollateralToken("Collateral", 1000000, 1000000, 5.0, stablecoin),
                 stablecoin_base_quantity=-10,
                 fee=-1.0,
                 formula=ConstantProductFormula(),
                 pool_recovery_period=0
             )
 
+    def test_invalid_pool_recovery_period(self):
+        """
+        Ensure a non-positive pool_recovery_period is rejected, at initialization and on assignment.
+        """
+        with self.assertRaises(ValueError):
+            SimpleVirtualLiquidityPool(
+                stablecoin=self.pool.token_a,
+                collateral=self.pool.token_b,
+                stablecoin_base_quantity=1000,
+                fee=0.003,
+                formula=ConstantProductFormula(),
+                pool_recovery_period=0
+            )
+        with self.assertRaises(ValueError):
+            self.pool.pool_recovery_period = -5
+        self.assertEqual(self.pool.pool_recovery_period, 10)
+
     def test_swap_stablecoin_for_collateral_and_replenishing_mechanism(self):
         """
         Test stablecoin swap adjusts delta as expected.
@@ -115,14 +149,47 @@ class TestSimpleVirtualLiquidityPool(unittest.TestCase):
                                places=1)
         self.assertAlmostEqual(self.pool.quantity_token_b, initial_collateral_quantity + 9.0, places=1)
 
+    def test_swap_batch(self):
+        """
+        Test that a mixed-direction batch updates delta and the reserves as the same swaps applied one at a time
+        through swap, each priced against the virtual quantities at the start of the batch.
+        """
+        input_is_a = np.array([True, False, True, False])
+        amounts = np.array([10.0, 2.0, 5.0, 1.0])
+        self.pool.delta = 20.0
+
+        output_amounts = self.pool.swap_batch(input_is_a, amounts)
+
+        # Virtual quantities every swap of the batch is priced against
+        start_quantity_a = self.pool.stablecoin_base_quantity + 20.0
+        start_quantity_b = self.pool.stablecoin_base_quantity / self.pool.collateral_price
+        expected_delta, expected_quantity_a, expected_quantity_b = 20.0, start_quantity_a, start_quantity_b
+        for i in range(len(amounts)):
+            stablecoin = AlgorithmicStablecoin("Stablecoin", 1000000, 1000000, 1.0)
+            collateral = CollateralToken("Collateral", 1000000, 1000000, 5.0, stablecoin)
+            reference_pool = SimpleVirtualLiquidityPool(stablecoin, collateral, 1000, 0.003, ConstantProductFormula(),
+                                                        10)
+            reference_pool.delta = 20.0
+            token = stablecoin if input_is_a[i] else collateral
+            _, expected_output = reference_pool.swap(token, amounts[i])
+            self.assertAlmostEqual(output_amounts[i], expected_output, places=9)
+
+            expected_delta += reference_pool.delta - 20.0
+            expected_quantity_a += reference_pool.quantity_token_a - start_quantity_a
+            expected_quantity_b += reference_pool.quantity_token_b - start_quantity_b
+
+        self.assertAlmostEqual(self.pool.delta, expected_delta, places=9)
+        self.assertAlmostEqual(self.pool.quantity_token_a, expected_quantity_a, places=9)
+        self.assertAlmostEqual(self.pool.quantity_token_b, expected_quantity_b, places=9)
+
 
 class TestImprovedVirtualLiquidityPool(unittest.TestCase):
     def setUp(self):
         """
         Sets up an instance of ImprovedVirtualLiquidityPool for testing.
         """
-        stablecoin = AlgorithmicStablecoin("Stablecoin", 1000000, 1.0)
-        collateral = CollateralToken("Collateral", 1000000, 5.0)
+        stablecoin = AlgorithmicStablecoin("Stablecoin", 1000000, 1000000, 1.0)
+        collateral = CollateralToken("Collateral", 1000000, 1000000, 5.0, stablecoin)
         formula = ConstantProductFormula()
 
         self.pool = ImprovedVirtualLiquidityPool(
@@ -140,7 +207,7 @@ class TestImprovedVirtualLiquidityPool(unittest.TestCase):
         """
         self.assertEqual(self.pool.delta, 0)
         self.assertEqual(self.pool.collateral_price, 5.0)
-        self.assertEqual(self.pool.restore_values, [0] * self.pool.pool_recovery_period)
+        self.assertEqual(self.pool.restore_values.tolist(), [0.0] * self.pool.pool_recovery_period)
 
     def test_restore_delta_normal(self):
         """
@@ -188,7 +255,7 @@ class TestImprovedVirtualLiquidityPool(unittest.TestCase):
         self.pool.delta = 10.0
         self.pool.reset_replenishing_system()
         self.assertEqual(self.pool.delta, 0)
-        self.assertEqual(self.pool.restore_values, [0] * 10)
+        self.assertEqual(self.pool.restore_values.tolist(), [0.0] * 10)
 
     def test_invalid_shrink_restore_values(self):
         """
@@ -196,6 +263,17 @@ class TestImprovedVirtualLiquidityPool(unittest.TestCase):
         """
         with self.assertRaises(ValueError):
             self.pool.shrink_restore_values(-1)
+        with self.assertRaises(ValueError):
+            self.pool.shrink_restore_values(2.5)
+
+    def test_shrink_restore_values_numpy_integer(self):
+        """
+        Ensure shrink_restore_values accepts NumPy integers.
+        """
+        self.pool.restore_values = [0.02] * 10
+        self.pool.shrink_restore_values(np.int64(4))
+        self.assertEqual(len(self.pool.restore_values), 4)
+        self.assertAlmostEqual(float(sum(self.pool.restore_values)), 0.2)
 
     def test_price_below_all_thresholds(self):
         """
@@ -231,14 +309,57 @@ class TestImprovedVirtualLiquidityPool(unittest.TestCase):
         new_length = self.pool.compute_restore_values_new_length()
         self.assertEqual(new_length, 1, "New length should be 1 when price is exactly on the first threshold.")
 
+    def test_restore_delta_after_longer_period(self):
+        """
+        Test that restore_delta grows restore_values when the new length exceeds the current one.
+        """
+        self.pool.update_delta(10)
+        self.pool.pool_recovery_period = 20
+        self.pool.stablecoin_price = 1.0
+
+        self.pool.restore_delta()
+        self.assertEqual(len(self.pool.restore_values), 20)
+        self.assertAlmostEqual(float(sum(self.pool.restore_values)), self.pool.delta)
+
+        self.pool.update_delta(4)
+        self.assertEqual(len(self.pool.restore_values), 20)
+        self.assertAlmostEqual(float(sum(self.pool.restore_values)), self.pool.delta)
+
+    def test_pool_recovery_period_update(self):
+        """
+        Test that changing pool_recovery_period updates the new restore_values lengths and keeps the restore state.
+        """
+        self.pool.update_delta(10)
+        self.pool.pool_recovery_period = 20
+        self.assertEqual(self.pool.restore_values.tolist(), [1.0] * 10)
+        self.pool.stablecoin_price = 0.981
+        self.assertEqual(self.pool.compute_restore_values_new_length(), 16)
+        self.pool.stablecoin_price = 1.0
+        self.assertEqual(self.pool.compute_restore_values_new_length(), 20)
+
+        self.pool.restore_delta()
+        self.assertEqual(len(self.pool.restore_values), 20)
+        self.assertAlmostEqual(float(sum(self.pool.restore_values)), 9.0)
+        self.assertAlmostEqual(self.pool.delta, 9.0)
+
+        self.pool.update_delta(2)
+        self.assertEqual(len(self.pool.restore_values), 20)
+        self.assertAlmostEqual(float(sum(self.pool.restore_values)), 11.0)
+        self.assertAlmostEqual(self.pool.delta, 11.0)
+
+        with self.assertRaises(ValueError):
+            self.pool.pool_recovery_period = 0
+        self.assertEqual(self.pool.pool_recovery_period, 20)
+
     def test_invalid_initialization(self):
         """
         Ensure invalid inputs for collateral_price raise exceptions.
         """
         with self.assertRaises(ValueError):
+            stablecoin = AlgorithmicStablecoin("Stablecoin", 1000000, 1000000, 1.0)
             ImprovedVirtualLiquidityPool(
-                stablecoin=AlgorithmicStablecoin("Stablecoin", 1000000, 1.0),
-                collateral=CollateralToken("Collateral", 1000000, 5.0),
+                stablecoin=stablecoin,
+                collateral=CollateralToken("Collateral", 1000000, 1000000, 5.0, stablecoin),
                 stablecoin_base_quantity=-10,
                 fee=-1.0,
                 formula=ConstantProductFormula(),
@@ -0,0 +1,53 @@
+import unittest
+import numpy as np
+from source.liquidity_pools.constant_product_formula import ConstantProductFormula
+from source.liquidity_pools.simple_virtual_liquidity_pool import SimpleVirtualLiquidityPool
+from source.simulations.parameter_sweep import run_sweep
+from source.tokens.algorithmic_stablecoin import AlgorithmicStablecoin
+from source.tokens.collateral_token import CollateralToken
+
+
+class TestParameterSweep(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        self.inputs = rng.normal(0.0, 50.0, size=200)
+
+    def simulate_with_pool(self, fee, pool_recovery_period, stablecoin_base_quantity, collateral_price):
+        stablecoin = AlgorithmicStablecoin("Stablecoin", 10 ** 9, 10 ** 8, 1.0)
+        collateral = CollateralToken("Collateral", 10 ** 9, 10 ** 8, collateral_price, stablecoin)
+        pool = SimpleVirtualLiquidityPool(stablecoin, collateral, stablecoin_base_quantity, fee,
+                                          ConstantProductFormula(), pool_recovery_period)
+        deltas = []
+        for amount in self.inputs:
+            if amount > 0:
+                pool.swap(stablecoin, amount)
+            else:
+                pool.swap(collateral, -amount)
+            pool.perform_pool_replenishing()
+            deltas.append(pool.delta)
+        return np.array(deltas)
+
+    def test_sweep_matches_virtual_liquidity_pool(self):
+        """Test that every parameter set reproduces the SimpleVirtualLiquidityPool delta trajectory"""
+        fees = np.array([0.0, 0.003, 0.01])
+        periods = np.array([10, 36, 200])
+        base_quantities = np.array([10000.0, 50000.0, 20000.0])
+        collateral_prices = np.array([5.0, 50.0, 1.5])
+
+        delta_history = run_sweep(fees, periods, base_quantities, collateral_prices, self.inputs)
+
+        self.assertEqual(delta_history.shape, (3, len(self.inputs)))
+        for i in range(3):
+            expected = self.simulate_with_pool(fees[i], int(periods[i]), base_quantities[i], collateral_prices[i])
+            np.testing.assert_allclose(delta_history[i], expected, rtol=1e-9, atol=1e-9)
+
+    def test_invalid_parameters(self):
+        """Test that mismatched or invalid parameter arrays are rejected"""
+        with self.assertRaises(ValueError):
+            run_sweep(np.array([0.003, 0.003]), np.array([10]), np.array([1000.0]), np.array([5.0]), self.inputs)
+        with self.assertRaises(ValueError):
+            run_sweep(np.array([0.003]), np.array([0]), np.array([1000.0]), np.array([5.0]), self.inputs)
+
+
+if __name__ == '__main__':
+    unittest.main()
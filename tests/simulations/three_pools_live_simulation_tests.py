@@ -0,0 +1,103 @@
+import queue
+import unittest
+from unittest.mock import MagicMock
+
+from source.liquidity_pools.constant_product_formula import ConstantProductFormula
+from source.liquidity_pools.liquidity_pool import LiquidityPool
+from source.liquidity_pools.simple_virtual_liquidity_pool import SimpleVirtualLiquidityPool
+from source.tokens.algorithmic_stablecoin import AlgorithmicStablecoin
+from source.tokens.collateral_token import CollateralToken
+from source.tokens.reference_token import ReferenceToken
+from source.purchase_generators.purchase_generator import PurchaseGenerator
+from source.simulations.three_pools_live_simulation import ThreePoolsLiveSimulation
+
+
+class TestThreePoolsLiveSimulation(unittest.TestCase):
+    def setUp(self):
+        """
+        Set up a live simulation whose market simulator only moves the prices and the delta.
+        """
+        self.stablecoin_token = AlgorithmicStablecoin(name="AS", initial_supply=10000, initial_free_supply=5000,
+                                                      initial_price=1.0, peg=1.0)
+        self.collateral_token = CollateralToken(name="CT", initial_supply=10000, initial_free_supply=5000,
+                                                initial_price=50.0, algorithmic_stablecoin=self.stablecoin_token)
+        self.reference_token = ReferenceToken(name="USD")
+
+        self.stablecoin_pool = LiquidityPool(token_a=self.stablecoin_token, token_b=self.reference_token,
+                                             quantity_token_a=5000, quantity_token_b=5000,
+                                             formula=ConstantProductFormula(), fee=0)
+        self.collateral_pool = LiquidityPool(token_a=self.collateral_token, token_b=self.reference_token,
+                                             quantity_token_a=5000, quantity_token_b=500,
+                                             formula=ConstantProductFormula(), fee=0)
+        self.virtual_pool = SimpleVirtualLiquidityPool(stablecoin=self.stablecoin_token,
+                                                       collateral=self.collateral_token,
+                                                       formula=ConstantProductFormula(),
+                                                       stablecoin_base_quantity=1000,
+                                                       fee=0,
+                                                       pool_recovery_period=10)
+
+        self.simulation = ThreePoolsLiveSimulation(
+            stablecoin_token=self.stablecoin_token,
+            collateral_token=self.collateral_token,
+            reference_token=self.reference_token,
+            stablecoin_pool=self.stablecoin_pool,
+            collateral_pool=self.collateral_pool,
+            virtual_pool=self.virtual_pool,
+            stablecoin_purchase_generator=MagicMock(spec=PurchaseGenerator),
+            collateral_purchase_generator=MagicMock(spec=PurchaseGenerator)
+        )
+
+        def mock_execute_random_purchases():
+            self.stablecoin_token.price += 0.01
+            self.virtual_pool.delta += 0.1
+
+        self.simulation.market_simulator.execute_random_purchases = mock_execute_random_purchases
+
+    def test_step_without_snapshot_queue(self):
+        """
+        Test that steps only record the history when no snapshot queue is set.
+        """
+        self.simulation.step_simulation()
+        self.assertEqual(self.simulation.number_of_iterations, 1)
+        self.assertEqual(self.simulation.stablecoin_price_history.tolist(), [1.0])
+
+    def test_history_capacity(self):
+        """
+        Test that the history keeps only the latest steps once it exceeds its capacity.
+        """
+        self.simulation = ThreePoolsLiveSimulation(
+            self.stablecoin_token, self.collateral_token, self.reference_token, self.stablecoin_pool,
+            self.collateral_pool, self.virtual_pool, MagicMock(spec=PurchaseGenerator),
+            MagicMock(spec=PurchaseGenerator), history_capacity=4)
+        self.simulation.market_simulator.execute_random_purchases = lambda: setattr(
+            self.virtual_pool, "delta", self.virtual_pool.delta + 1)
+
+        for steps in range(1, 11):
+            self.simulation.step_simulation()
+            expected = list(range(max(steps - 4, 0), steps))
+            self.assertEqual(self.simulation.delta_variation_history.tolist(), expected)
+
+        with self.assertRaises(ValueError):
+            self.simulation.set_snapshot_queue(queue.Queue(), window=5)
+
+    def test_publish_snapshot(self):
+        """
+        Test that each step publishes the latest window of history and a full queue drops the oldest snapshot.
+        """
+        snapshot_queue = queue.Queue(maxsize=2)
+        self.simulation.set_snapshot_queue(snapshot_queue, window=3)
+
+        for _ in range(5):
+            self.simulation.step_simulation()
+
+        self.assertEqual(snapshot_queue.qsize(), 2)
+        snapshot_queue.get_nowait()
+        iteration, stablecoin_prices, collateral_prices, deltas = snapshot_queue.get_nowait()
+        self.assertEqual(iteration, 5)
+        self.assertEqual(stablecoin_prices.tolist(), self.simulation.stablecoin_price_history[2:].tolist())
+        self.assertEqual(collateral_prices.tolist(), [50.0] * 3)
+        self.assertEqual(len(deltas), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -121,12 +121,30 @@ class TestTokenClasses(unittest.TestCase):
         with self.assertRaises(ValueError):
             genericToken2.supply = 699
 
+    def test_free_supply_change(self):
+        """Test direct and checked updates of the free supply"""
+        generic_token = GenericToken("BTC", 1000, 900, 50000.0)
+
+        generic_token.free_supply -= 100  # Direct assignment, no validation
+        self.assertEqual(generic_token.free_supply, 800)
+
+        generic_token.set_free_supply_checked(500)
+        self.assertEqual(generic_token.free_supply, 500.0)
+        generic_token.set_free_supply_checked(0.005)  # Rounded to zero
+        self.assertEqual(generic_token.free_supply, 0.0)
+
+        with self.assertRaises(ValueError):
+            generic_token.set_free_supply_checked(-10)  # Cannot be negative
+        with self.assertRaises(ValueError):
+            generic_token.set_free_supply_checked(1001)  # Cannot exceed supply
+
     def test_token_equality(self):
         """Test token object identity comparison"""
         token1 = GenericToken("TEST1", 1000, 900, 10.0)
         token2 = token1
         
-        self.assertTrue(token1.is_equal(token2))  # Same object should be equal
+        self.assertTrue(token1 == token2)  # Same object should be equal
+        self.assertFalse(token1 == GenericToken("TEST1", 1000, 900, 10.0))  # Equal attributes, different object
 
     def test_algorithmic_stablecoin_price_adjustment(self):
         """Test price adjustment behavior in Algorithmic Stablecoin"""